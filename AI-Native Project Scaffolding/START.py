@@ -8,7 +8,9 @@ WORKFLOW:
 2. Runs the "Builder" (builder.py) to create files.
 """
 
+import importlib.util
 import os
+import shutil
 import sys
 from pathlib import Path
 
@@ -17,10 +19,37 @@ TOOLKIT_DIR = Path(__file__).parent.resolve()
 MANIFESTO_PATH = TOOLKIT_DIR / "manifesto.md"
 BUILDER_PATH = TOOLKIT_DIR / "builder.py"
 
+def load_builder():
+    """Load builder.py straight from its file instead of searching sys.path"""
+    # builder.py imports _templates from its own folder, which is not on
+    # sys.path under `python -P` / PYTHONSAFEPATH
+    if str(TOOLKIT_DIR) not in sys.path:
+        sys.path.insert(0, str(TOOLKIT_DIR))
+    spec = importlib.util.spec_from_file_location("builder", BUILDER_PATH)
+    builder = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(builder)
+    return builder
+
+def print_manifesto(manifesto):
+    """Stream the open (binary) manifesto file to stdout"""
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # Text-only stream (e.g. redirected by an IDE)
+        print(manifesto.read().decode('utf-8'))
+        return
+    
+    sys.stdout.flush()
+    shutil.copyfileobj(manifesto, out)
+    out.flush()
+    print()
+
 def main():
-    # 1. Check for required tools
-    if not MANIFESTO_PATH.exists() or not BUILDER_PATH.exists():
-        print("❌ ERROR: manifesto.md or builder.py not found")
+    # 1. Load required tools (opening them is the existence check)
+    try:
+        builder = load_builder()
+        manifesto = open(MANIFESTO_PATH, 'rb')
+    except (FileNotFoundError, ImportError):
+        print("❌ ERROR: manifesto.md, builder.py or _templates.py not found")
         print(f"Make sure they are in: {TOOLKIT_DIR}")
         return
 
@@ -28,7 +57,8 @@ def main():
     print("\n" + "="*60)
     print("🧠 LOADING KNOWLEDGE BASE (File #1)...")
     print("="*60)
-    print(MANIFESTO_PATH.read_text(encoding='utf-8'))
+    with manifesto:
+        print_manifesto(manifesto)
     print("\n" + "="*60)
     print("🤖 INSTRUCTIONS FOR CURSOR AGENT:")
     print("1. You just read the Manifesto above. This is LAW.")
@@ -45,9 +75,6 @@ def main():
     if not project_name:
         return
 
-    # Import and run builder.py as module
-    sys.path.append(str(TOOLKIT_DIR))
-    import builder
     builder.run(project_name)
 
     print(f"\n✨ Project {project_name} initialized.")
@@ -0,0 +1,528 @@
+"""
+📦 Shared file templates for builder.py and CONTEXT SWITCHER.py
+
+Both generators import their templates from here so each constant exists
+once. Placeholder-free templates that are written as bytes are also
+exported pre-encoded (``*_BYTES``).
+"""
+
+from string import Template
+
+# ═══════════════════════════════════════════════════════════════
+# builder.py TEMPLATES
+# ═══════════════════════════════════════════════════════════════
+
+CURSORIGNORE = '''# ═══════════════════════════════════════
+# CURSOR IGNORE — DO NOT INDEX
+# Generated: {date}
+# ═══════════════════════════════════════
+
+# === VIRTUAL ENVIRONMENTS ===
+venv/
+.venv/
+env/
+.env/
+**/venv/
+**/.venv/
+**/site-packages/
+**/lib/python*/
+**/Lib/site-packages/
+**/Scripts/
+**/bin/python*
+
+# === PLAYWRIGHT ===
+**/playwright/driver/
+**/playwright/.local-browsers/
+**/.cache/ms-playwright/
+
+# === PYTHON CACHES ===
+__pycache__/
+**/__pycache__/
+*.py[cod]
+*$py.class
+*.pyo
+*.pyc
+.pytest_cache/
+.mypy_cache/
+.ruff_cache/
+.coverage
+htmlcov/
+
+# === LOGS ===
+logs/
+*.log
+*.log.*
+
+# === DATA ===
+data/
+artifacts/
+*.csv
+*.sqlite3
+*.sqlite
+*.db
+
+# === BINARIES ===
+*.exe
+*.so
+*.dll
+*.dylib
+
+# === ASSETS ===
+assets/
+*.png
+*.jpg
+*.jpeg
+*.gif
+*.ico
+*.webp
+*.woff
+*.woff2
+*.ttf
+*.eot
+
+# === ARCHIVES ===
+*.zip
+*.tar
+*.tar.gz
+*.rar
+*.7z
+
+# === GIT ===
+.git/
+
+# === NODE ===
+node_modules/
+package-lock.json
+yarn.lock
+
+# === SECRETS ===
+.env
+.env.*
+!.env.example
+*.pem
+*.key
+*.secret
+
+# === IDE ===
+.idea/
+.vscode/settings.json
+*.swp
+*.swo
+*~
+'''
+
+CURSORRULES = '''# ═══════════════════════════════════════════════════════════
+# RULES FOR AI — {project_name}
+# Generated: {date}
+# ═══════════════════════════════════════════════════════════
+
+## 🧠 FIRST ACTION ON ANY REQUEST
+
+1. Read `_AI_INCLUDE/` — all paths and rules are there
+2. Check existing files before creating
+3. Follow project structure
+
+---
+
+## 🚫 ABSOLUTE PROHIBITIONS
+
+### Never create inside project:
+- `venv/`, `.venv/`, `env/` — environments stored in `../_venvs/`
+- Duplicates of existing files
+- New requirements.txt in subfolders
+
+### Never read entirely:
+- `logs/*.log` → use `tail -50`
+- `data/*.csv` → use `head -10`
+- `*.sqlite3` → use SQL queries
+- Any files > 100KB without explicit need
+
+---
+
+## ✅ CORRECT ACTIONS
+
+### New Python package:
+```bash
+source ../_venvs/{project_name}-venv/bin/activate
+pip install <package>
+pip freeze > requirements.txt
+```
+
+### Data from CSV:
+```bash
+head -10 data/file.csv
+grep -i "search" data/file.csv | head -5
+wc -l data/file.csv
+```
+
+### DB structure:
+```bash
+sqlite3 database/app.sqlite3 ".schema"
+sqlite3 database/app.sqlite3 "SELECT * FROM table LIMIT 5"
+```
+
+### Logs:
+```bash
+tail -50 logs/bot.log
+grep -i "error" logs/bot.log | tail -20
+```
+
+---
+
+## 📍 PROJECT STRUCTURE
+
+### Code (read/edit freely):
+```
+bot/                 — Telegram bot
+├── handlers/        — command handlers
+├── keyboards/       — keyboards
+├── utils/           — utilities
+├── middlewares/     — middleware
+└── main.py          — entry point
+
+webapp/              — Mini App (HTML/JS/CSS)
+scripts/             — Python scripts
+database/db.py       — DB operations
+api/                 — web server
+config.py            — configuration
+```
+
+### Read carefully (only with good reason):
+```
+logs/               — logs (use tail/grep)
+data/               — data files
+database/*.sqlite3  — database
+```
+
+### Don't touch:
+```
+../_venvs/          — virtual environments
+.git/               — git
+```
+
+---
+
+## 🎯 AI BEHAVIOR
+
+1. **Always read _AI_INCLUDE/ first**
+2. Keep existing code and style
+3. Use project conventions
+4. Ask if unclear
+'''
+
+BOOTSTRAP_SH = '''#!/bin/bash
+# ═══════════════════════════════════════════════════════════
+# BOOTSTRAP — Creates venv OUTSIDE project
+# ═══════════════════════════════════════════════════════════
+
+set -e
+
+PROJECT_NAME="{project_name}"
+VENV_DIR="../_venvs/${{PROJECT_NAME}}-venv"
+
+echo "🚀 Setting up $PROJECT_NAME..."
+
+# Create _venvs directory
+mkdir -p "$(dirname "$VENV_DIR")"
+
+# Create venv if doesn't exist
+if [ ! -d "$VENV_DIR" ]; then
+    echo "📦 Creating venv in $VENV_DIR..."
+    python3 -m venv "$VENV_DIR"
+fi
+
+# Activate and install
+echo "📥 Installing dependencies..."
+source "$VENV_DIR/bin/activate"
+pip install --upgrade pip
+pip install -r requirements.txt
+
+echo ""
+echo "✅ Done!"
+echo ""
+echo "To activate:"
+echo "  source $VENV_DIR/bin/activate"
+'''
+
+CONTEXT_SWITCHER = '''#!/usr/bin/env python3
+"""
+🎮 Context Switcher — Hide parts of project from AI
+Usage:
+    python context.py bot      # Focus on bot
+    python context.py webapp   # Focus on webapp
+    python context.py all      # Show all
+    python context.py status   # Current status
+"""
+
+import sys
+from pathlib import Path
+
+BASE_IGNORE = """
+venv/
+.venv/
+.env
+**/__pycache__/
+.git/
+logs/
+data/
+artifacts/
+"""
+
+MODULES = {
+    "bot": ["bot/", "handlers/"],
+    "webapp": ["webapp/", "frontend/"],
+    "parser": ["parser/"],
+    "api": ["api/"],
+    "database": ["database/"],
+}
+
+# Ignore block for each mode, rendered once at import
+_RENDERED = {
+    mode: "".join(
+        f"\\n# Hidden: {mod}" + "".join(f"\\n{p}" for p in paths)
+        for mod, paths in MODULES.items()
+        if mod != mode
+    )
+    for mode in MODULES
+}
+_RENDERED["all"] = "\\n# All modules visible"
+
+def update_cursorignore(mode: str):
+    """Update .cursorignore for selected mode"""
+    Path(".cursorignore").write_text(
+        BASE_IGNORE.strip()
+        + f"\\n\\n# === MODE: {mode.upper()} ===\\n"
+        + _RENDERED.get(mode, ""),
+        encoding="utf-8",
+    )
+    print(f"✅ Mode set to: {mode.upper()}")
+
+def show_status():
+    """Show current mode"""
+    ignore = Path(".cursorignore")
+    if not ignore.exists():
+        print("ℹ️ No .cursorignore found")
+        return
+    
+    with ignore.open(encoding="utf-8") as f:
+        for line in f:
+            if "MODE:" in line:
+                print(f"📍 Current: {line.rstrip()}")
+                return
+    print("📍 Current: default")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(0)
+    
+    cmd = sys.argv[1].lower()
+    
+    if cmd == "status":
+        show_status()
+    elif cmd in MODULES or cmd == "all":
+        update_cursorignore(cmd)
+    else:
+        print(f"❌ Unknown mode: {cmd}")
+        print(f"Available: {', '.join(MODULES.keys())}, all")
+'''
+
+CONFIG_PY = b'''"""Configuration"""
+from pydantic_settings import BaseSettings
+
+class Settings(BaseSettings):
+    BOT_TOKEN: str = ""
+    
+    class Config:
+        env_file = ".env"
+
+settings = Settings()
+'''
+
+REQUIREMENTS_TXT = b'''aiogram>=3.0
+python-dotenv
+pydantic-settings
+'''
+
+ENV_EXAMPLE = b'''BOT_TOKEN=your_token_here
+'''
+
+
+# Per-project bodies, substituted with string.Template ($name)
+
+BOT_MAIN_PY = Template('''"""
+$name — Telegram Bot
+"""
+
+import asyncio
+import logging
+from aiogram import Bot, Dispatcher
+from config import settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def main():
+    bot = Bot(token=settings.BOT_TOKEN)
+    dp = Dispatcher()
+    
+    logger.info("Starting bot...")
+    await dp.start_polling(bot)
+
+if __name__ == "__main__":
+    asyncio.run(main())
+''')
+
+README_MD = Template('''# $name
+
+## Quick Start
+
+```bash
+# 1. Create venv (OUTSIDE project!)
+./scripts/bootstrap.sh
+
+# 2. Activate
+source ../_venvs/$name-venv/bin/activate
+
+# 3. Configure
+cp .env.example .env
+# Edit .env with your token
+
+# 4. Run
+python bot/main.py
+```
+
+## Structure
+
+```
+$name/
+├── bot/                 # Telegram bot
+├── webapp/              # Mini App
+├── database/            # DB operations
+├── scripts/             # Utility scripts
+├── _AI_INCLUDE/         # AI rules
+└── config.py            # Configuration
+```
+
+## For AI
+
+Read `_AI_INCLUDE/` first!
+''')
+
+PROJECT_CONVENTIONS_MD = Template('''# Project Conventions — $name
+
+## Key Rules
+
+1. **venv** — always in `../_venvs/$name-venv/`
+2. **Structure** — follow existing patterns
+3. **Logging** — use `logging` module
+4. **Config** — use `config.py` and `.env`
+
+## Code Style
+
+- Python 3.10+
+- Type hints
+- Docstrings
+- max 100 chars per line
+''')
+
+WHERE_IS_WHAT_MD = Template('''# Where Is What — $name
+
+## Main Files
+
+| What | Where |
+|------|-------|
+| Bot entry | `bot/main.py` |
+| Config | `config.py` |
+| Handlers | `bot/handlers/` |
+| Database | `database/` |
+| Scripts | `scripts/` |
+
+## Key Commands
+
+```bash
+# Activate venv
+source ../_venvs/$name-venv/bin/activate
+
+# Run bot
+python bot/main.py
+
+# Context switch
+python scripts/context.py bot
+```
+''')
+
+
+# ═══════════════════════════════════════════════════════════════
+# CONTEXT SWITCHER.py TEMPLATES
+# ═══════════════════════════════════════════════════════════════
+
+# === YOUR KILLER FEATURE: Context Switcher ===
+CONTEXT_SCRIPT = '''#!/usr/bin/env python3
+"""
+🎮 CONTEXT SWITCHER — Original Method
+Hides parts of the project from Cursor so it doesn't get confused.
+"""
+import sys
+
+BASE_IGNORE = """
+venv/
+.venv/
+.env
+**/__pycache__/
+.git/
+logs/
+data/
+artifacts/
+"""
+
+MODULES = {
+    "bot": ["bot/", "bot.py"],
+    "webapp": ["webapp/", "frontend/"],
+    "parser": ["parser/"],
+    "api": ["api/"],
+    "db": ["database/"]
+}
+
+def ignore_lines(mode):
+    yield BASE_IGNORE.strip()
+    yield f"\\n# === MODE: {mode.upper()} ===\\n"
+    if mode == "all":
+        yield "# All modules visible"
+    else:
+        for m, paths in MODULES.items():
+            if m != mode:
+                yield f"# Ignoring {m}"
+                yield from paths
+
+def update(mode):
+    lines = ignore_lines(mode)
+    with open(".cursorignore", "w", encoding="utf-8") as f:
+        f.write(next(lines))
+        f.writelines("\\n" + line for line in lines)
+    print(f"✅ Mode: {mode.upper()}")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python context.py [bot|webapp|parser|api|all]")
+    else:
+        update(sys.argv[1].lower())
+'''
+
+# === BOOTSTRAP SCRIPT ===
+BOOTSTRAP = '''#!/bin/bash
+set -e
+PROJ=$(basename "$PWD")
+VENV="../../_venvs/${PROJ}-venv"
+echo "🚀 Setup $PROJ in $VENV"
+mkdir -p "$VENV"
+if [ ! -d "$VENV/bin" ]; then python3 -m venv "$VENV"; fi
+echo "✅ Done. Run: source $VENV/bin/activate"
+'''
+
+
+# ═══════════════════════════════════════════════════════════════
+# PRE-ENCODED (no placeholders)
+# ═══════════════════════════════════════════════════════════════
+
+CONTEXT_SWITCHER_BYTES = CONTEXT_SWITCHER.encode('utf-8')
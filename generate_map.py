@@ -1,6 +1,6 @@
 import os
 import re
-from pathlib import Path
+import mmap
 
 # ==========================================
 # ⚙️ SETTINGS (FROM AI TOOLKIT MANIFESTO)
@@ -22,44 +22,86 @@ IGNORE_FILES = {
 }
 
 # Extensions we ignore
-IGNORE_EXT = {
+IGNORE_EXT = frozenset({
     '.pyc', '.pyo', '.pyd', '.so', '.dll', '.class', '.exe', 
     '.png', '.jpg', '.jpeg', '.gif', '.ico', '.svg', 
     '.woff', '.woff2', '.ttf', '.eot', 
     '.zip', '.tar', '.gz', '.7z', '.rar',
     '.db', '.sqlite', '.sqlite3'
-}
+})
 
 # Regex for finding classes and functions (Regex - Architect's choice)
 # Catches: class Name, def name, async def name
-DEFINITION_PATTERN = re.compile(r'^\s*(class|def|async\s+def)\s+([a-zA-Z0-9_]+)')
+# Run over the whole file as bytes; [ \t...] instead of \s keeps each match on one line
+DEFINITION_PATTERN = re.compile(
+    rb'^[ \t\f\v\x1c-\x1f]*(class|def|async[ \t\f\v\x1c-\x1f]+def)[ \t\f\v\x1c-\x1f]+([a-zA-Z0-9_]+)',
+    re.MULTILINE,
+)
+
+# Files at least this big are scanned through mmap; smaller ones are cheaper to read()
+MMAP_MIN_SIZE = 64 * 1024
 
-def estimate_tokens(text):
-    """Approximate token estimation (1 token ≈ 4 chars)"""
-    return len(text) // 4
+def format_definitions(data):
+    """Map lines for the classes and functions found in data (bytes or mmap)"""
+    definitions = []
+    # One C-level scan instead of a Python loop per line
+    for match in DEFINITION_PATTERN.finditer(data):
+        name = match.group(2).decode('ascii')
+        
+        # Format with icons for clarity
+        if match.group(1) == b'class':
+            definitions.append(f"  📦 {name}")
+        else:
+            definitions.append(f"    ƒ {name}")
+    return definitions
 
 def get_definitions(file_path):
     """Fast file reading via Regex without AST parsing"""
-    definitions = []
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                match = DEFINITION_PATTERN.match(line)
-                if match:
-                    type_ = match.group(1).replace('async def', 'async_def') # Simplify for output
-                    name = match.group(2)
-                    
-                    # Format with icons for clarity
-                    if 'class' in type_:
-                        definitions.append(f"  📦 {name}")
-                    else:
-                        definitions.append(f"    ƒ {name}")
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+                data = f.read()
+            else:
+                # Large file: scan the kernel's pages in place, no copy to the heap
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b'\r') == -1:
+                        return format_definitions(mm)
+                    data = mm[:]
     except Exception:
-        pass # If file is broken or unreadable - skip
-    return definitions
+        return [] # If file is unreadable - skip
+    
+    # Same line breaks as text mode
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    
+    return format_definitions(data)
+
+def walk(dir_path):
+    """Top-down (dir_path, file names) like os.walk, via os.scandir; IGNORE_DIRS pruned"""
+    files = []
+    subdirs = []
+    try:
+        it = os.scandir(dir_path)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()  # cached from readdir, no extra stat
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry.name)
+            elif entry.name not in IGNORE_DIRS and not entry.is_symlink():
+                subdirs.append(entry.path)
+    
+    yield dir_path, files
+    for subdir in subdirs:
+        yield from walk(subdir)
 
 def generate_map():
-    root_path = Path('.')
+    root_path = '.'
+    root_prefix = root_path + os.sep  # walk() paths below the root start with it
     output_lines = []
     
     # Header for AI
@@ -68,21 +110,21 @@ def generate_map():
     
     total_files = 0
     
-    for root, dirs, files in os.walk(root_path):
-        # 1. In-place folder filtration
-        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
-        
-        rel_root = Path(root)
+    for root, files in walk(root_path):
+        # Plain strings, shown as str(Path(root) / file) would show them
+        rel_root = root[len(root_prefix):] if root.startswith(root_prefix) else ''
         
         # Sort for aesthetics
         files.sort()
         
         for file in files:
-            file_path = rel_root / file
-            
-            # Skip ignored files and extensions
-            if file in IGNORE_FILES or file_path.suffix in IGNORE_EXT:
+            # Skip ignored files and extensions (as Path.suffix; a bare
+            # trailing "." is in no set, so dot > 0 is the only check)
+            dot = file.rfind('.')
+            if file in IGNORE_FILES or (dot > 0 and file[dot:] in IGNORE_EXT):
                 continue
+            
+            file_path = os.path.join(rel_root, file)
                 
             total_files += 1
             
@@ -97,16 +139,14 @@ def generate_map():
             
             output_lines.append("") # Empty line separator
 
-    # Final write
-    result_text = "\n".join(output_lines)
-    
-    # Statistics
-    map_tokens = estimate_tokens(result_text)
-    stats = f"\n---\n**Stats:** Scanned {total_files} files. Map size: ~{map_tokens} tokens."
-    result_text += stats
+    # Statistics: the joined map's length, without building it just to measure
+    map_chars = sum(map(len, output_lines)) + len(output_lines) - 1
+    map_tokens = map_chars // 4  # approximate: 1 token ≈ 4 chars
+    output_lines.append(f"---\n**Stats:** Scanned {total_files} files. Map size: ~{map_tokens} tokens.")
 
+    # Final write: one join, one write() (no copy to tack the stats on)
     with open("CURRENT_CONTEXT_MAP.md", "w", encoding="utf-8") as f:
-        f.write(result_text)
+        f.write("\n".join(output_lines))
         
     print(f"✅ Context Map Updated! (~{map_tokens} tokens)")
     print(f"   Created: CURRENT_CONTEXT_MAP.md")
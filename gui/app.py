@@ -7,11 +7,14 @@ Allows creating, cleaning and managing projects through UI.
 
 from __future__ import annotations
 
+import re
 import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 from typing import Callable
+import functools
+import queue
 import threading
 
 # Add path to src
@@ -47,6 +50,65 @@ FONTS = {
     "mono": ("Consolas", 10),
 }
 
+# ttk styles: (style name, options), applied in order by setup_styles()
+STYLES = (
+    # Frame
+    ("TFrame", {"background": COLORS["bg"]}),
+    ("Secondary.TFrame", {"background": COLORS["bg_secondary"]}),
+    
+    # Label
+    ("TLabel", {"background": COLORS["bg"], "foreground": COLORS["fg"], "font": FONTS["body"]}),
+    ("Heading.TLabel", {"font": FONTS["heading"]}),
+    ("Subheading.TLabel", {"font": FONTS["subheading"]}),
+    
+    # Button
+    ("TButton", {
+        "background": COLORS["accent"],
+        "foreground": COLORS["bg"],
+        "font": FONTS["body"],
+        "padding": (20, 10),
+    }),
+    ("Success.TButton", {"background": COLORS["success"]}),
+    ("Danger.TButton", {"background": COLORS["error"]}),
+    
+    # Entry
+    ("TEntry", {"fieldbackground": COLORS["bg_secondary"], "foreground": COLORS["fg"], "font": FONTS["body"]}),
+    
+    # Radiobutton
+    ("TRadiobutton", {"background": COLORS["bg"], "foreground": COLORS["fg"], "font": FONTS["body"]}),
+    
+    # Checkbutton
+    ("TCheckbutton", {"background": COLORS["bg"], "foreground": COLORS["fg"], "font": FONTS["body"]}),
+    
+    # Notebook
+    ("TNotebook", {"background": COLORS["bg"]}),
+    ("TNotebook.Tab", {"background": COLORS["bg_secondary"], "foreground": COLORS["fg"], "padding": (20, 10)}),
+)
+
+# Valid project name: letters (any script), digits, _ and -, with at least one
+# letter or digit; same rule as create's replace("_"/"-") + isalnum() check
+PROJECT_NAME = re.compile(r'[_-]*[^\W_][\w-]*')
+
+# Radiobutton labels (value -> label); TEMPLATES and IDE_CONFIGS never change
+TEMPLATE_LABELS = tuple(
+    (key, f"{tmpl['icon']} {tmpl['name']} — {tmpl['description']}") for key, tmpl in TEMPLATES.items()
+)
+IDE_LABELS = {key: f"{cfg['icon']} {cfg['name']}" for key, cfg in IDE_CONFIGS.items()}
+# ai_targets per IDE (kept as lists: get_default_ai_targets() copies them)
+IDE_TARGETS = {key: cfg["ai_targets"] for key, cfg in IDE_CONFIGS.items()}
+
+# Default location for new projects (fixed for the session)
+HOME_DIR = str(Path.home())
+
+# Most lines a results Text widget keeps; older ones are dropped from the top
+MAX_RESULT_LINES = 5000
+
+# How often the Tk thread picks up finished background jobs
+RESULT_POLL_MS = 30
+
+# How often the Health tab picks up report output while a check runs
+HEALTH_POLL_MS = 50
+
 
 # ══════════════════════════════════════════════════════════════
 # Main Window
@@ -68,91 +130,28 @@ class AIToolkitApp:
         self.selected_ide = tk.StringVar(value="all")
         self.selected_template = tk.StringVar(value="bot")
         self.project_name = tk.StringVar(value="my_project")
-        self.project_path = tk.StringVar(value=str(Path.home()))
+        self.project_path = tk.StringVar(value=HOME_DIR)
         self.include_docker = tk.BooleanVar(value=True)
         self.include_ci = tk.BooleanVar(value=True)
         self.include_git = tk.BooleanVar(value=True)
         
         # UI
         self.create_ui()
+        
+        # Background work: one long-lived worker thread; finished jobs are
+        # handed back through a queue the Tk thread polls
+        self.jobs: queue.Queue = queue.Queue()
+        self.results: queue.Queue = queue.Queue()
+        threading.Thread(target=self.worker, daemon=True).start()
+        self.root.after(RESULT_POLL_MS, self.drain_results)
     
     def setup_styles(self):
         """Setup ttk styles"""
         style = ttk.Style()
         style.theme_use("clam")
         
-        # Frame
-        style.configure("TFrame", background=COLORS["bg"])
-        style.configure("Secondary.TFrame", background=COLORS["bg_secondary"])
-        
-        # Label
-        style.configure(
-            "TLabel",
-            background=COLORS["bg"],
-            foreground=COLORS["fg"],
-            font=FONTS["body"],
-        )
-        style.configure(
-            "Heading.TLabel",
-            font=FONTS["heading"],
-        )
-        style.configure(
-            "Subheading.TLabel",
-            font=FONTS["subheading"],
-        )
-        
-        # Button
-        style.configure(
-            "TButton",
-            background=COLORS["accent"],
-            foreground=COLORS["bg"],
-            font=FONTS["body"],
-            padding=(20, 10),
-        )
-        style.configure(
-            "Success.TButton",
-            background=COLORS["success"],
-        )
-        style.configure(
-            "Danger.TButton",
-            background=COLORS["error"],
-        )
-        
-        # Entry
-        style.configure(
-            "TEntry",
-            fieldbackground=COLORS["bg_secondary"],
-            foreground=COLORS["fg"],
-            font=FONTS["body"],
-        )
-        
-        # Radiobutton
-        style.configure(
-            "TRadiobutton",
-            background=COLORS["bg"],
-            foreground=COLORS["fg"],
-            font=FONTS["body"],
-        )
-        
-        # Checkbutton
-        style.configure(
-            "TCheckbutton",
-            background=COLORS["bg"],
-            foreground=COLORS["fg"],
-            font=FONTS["body"],
-        )
-        
-        # Notebook
-        style.configure(
-            "TNotebook",
-            background=COLORS["bg"],
-        )
-        style.configure(
-            "TNotebook.Tab",
-            background=COLORS["bg_secondary"],
-            foreground=COLORS["fg"],
-            padding=(20, 10),
-        )
+        for name, options in STYLES:
+            style.configure(name, **options)
     
     def create_ui(self):
         """Create UI"""
@@ -184,17 +183,22 @@ class AIToolkitApp:
         # Tab 2: Cleanup
         cleanup_frame = ttk.Frame(notebook)
         notebook.add(cleanup_frame, text="🧹 Cleanup")
-        self.create_cleanup_tab(cleanup_frame)
         
         # Tab 3: Health
         health_frame = ttk.Frame(notebook)
         notebook.add(health_frame, text="🏥 Health Check")
-        self.create_health_tab(health_frame)
         
         # Tab 4: Settings
         settings_frame = ttk.Frame(notebook)
         notebook.add(settings_frame, text="⚙️ Settings")
-        self.create_settings_tab(settings_frame)
+        
+        # Tabs 2-4 get their widgets the first time they are selected
+        self.pending_tabs: dict[str, tuple[ttk.Frame, Callable[[ttk.Frame], None]]] = {
+            str(cleanup_frame): (cleanup_frame, self.create_cleanup_tab),
+            str(health_frame): (health_frame, self.create_health_tab),
+            str(settings_frame): (settings_frame, self.create_settings_tab),
+        }
+        notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
     
     def create_create_tab(self, parent: ttk.Frame):
         """Project creation tab"""
@@ -215,21 +219,7 @@ class AIToolkitApp:
         
         ttk.Label(path_frame, text="📍 Path:").pack(anchor="w")
         
-        path_input_frame = ttk.Frame(path_frame)
-        path_input_frame.pack(fill="x", pady=5)
-        
-        ttk.Entry(
-            path_input_frame,
-            textvariable=self.project_path,
-            width=40,
-        ).pack(side="left", fill="x", expand=True)
-        
-        ttk.Button(
-            path_input_frame,
-            text="📂",
-            command=self.browse_path,
-            width=3,
-        ).pack(side="left", padx=5)
+        self.make_path_picker(path_frame, self.project_path, self.browse_path, width=40).pack(fill="x", pady=5)
         
         # Template
         template_frame = ttk.Frame(parent)
@@ -237,10 +227,10 @@ class AIToolkitApp:
         
         ttk.Label(template_frame, text="📦 Template:", style="Subheading.TLabel").pack(anchor="w")
         
-        for key, tmpl in TEMPLATES.items():
+        for key, label in TEMPLATE_LABELS:
             ttk.Radiobutton(
                 template_frame,
-                text=f"{tmpl['icon']} {tmpl['name']} — {tmpl['description']}",
+                text=label,
                 variable=self.selected_template,
                 value=key,
             ).pack(anchor="w", pady=2)
@@ -270,12 +260,13 @@ class AIToolkitApp:
         ).pack(anchor="w", pady=2)
         
         # Create button
-        ttk.Button(
+        self.create_button = ttk.Button(
             parent,
             text="✨ Create Project",
             command=self.do_create_project,
             style="Success.TButton",
-        ).pack(pady=20)
+        )
+        self.create_button.pack(pady=20)
     
     def create_cleanup_tab(self, parent: ttk.Frame):
         """Cleanup tab"""
@@ -295,36 +286,24 @@ class AIToolkitApp:
         
         self.cleanup_path = tk.StringVar()
         
-        path_frame = ttk.Frame(parent)
-        path_frame.pack(fill="x", padx=20, pady=10)
-        
-        ttk.Entry(
-            path_frame,
-            textvariable=self.cleanup_path,
-            width=50,
-        ).pack(side="left", fill="x", expand=True)
-        
-        ttk.Button(
-            path_frame,
-            text="📂",
-            command=lambda: self.browse_folder(self.cleanup_path),
-            width=3,
-        ).pack(side="left", padx=5)
+        self.make_path_picker(parent, self.cleanup_path).pack(fill="x", padx=20, pady=10)
         
         buttons_frame = ttk.Frame(parent)
         buttons_frame.pack(pady=20)
         
-        ttk.Button(
+        self.analyze_button = ttk.Button(
             buttons_frame,
             text="🔍 Analyze",
             command=self.do_analyze,
-        ).pack(side="left", padx=10)
+        )
+        self.analyze_button.pack(side="left", padx=10)
         
-        ttk.Button(
+        self.cleanup_button = ttk.Button(
             buttons_frame,
             text="🧹 Cleanup (medium)",
             command=lambda: self.do_cleanup("medium"),
-        ).pack(side="left", padx=10)
+        )
+        self.cleanup_button.pack(side="left", padx=10)
         
         # Results
         self.cleanup_results = tk.Text(
@@ -346,27 +325,14 @@ class AIToolkitApp:
         
         self.health_path = tk.StringVar()
         
-        path_frame = ttk.Frame(parent)
-        path_frame.pack(fill="x", padx=20, pady=10)
-        
-        ttk.Entry(
-            path_frame,
-            textvariable=self.health_path,
-            width=50,
-        ).pack(side="left", fill="x", expand=True)
-        
-        ttk.Button(
-            path_frame,
-            text="📂",
-            command=lambda: self.browse_folder(self.health_path),
-            width=3,
-        ).pack(side="left", padx=5)
+        self.make_path_picker(parent, self.health_path).pack(fill="x", padx=20, pady=10)
         
-        ttk.Button(
+        self.check_button = ttk.Button(
             parent,
             text="🏥 Check",
             command=self.do_health_check,
-        ).pack(pady=20)
+        )
+        self.check_button.pack(pady=20)
         
         # Results
         self.health_results = tk.Text(
@@ -392,10 +358,10 @@ class AIToolkitApp:
         
         ttk.Label(ide_frame, text="🖥️ Default IDE:").pack(anchor="w")
         
-        for key, cfg in IDE_CONFIGS.items():
+        for key, label in IDE_LABELS.items():
             ttk.Radiobutton(
                 ide_frame,
-                text=f"{cfg['icon']} {cfg['name']}",
+                text=label,
                 variable=self.selected_ide,
                 value=key,
             ).pack(anchor="w", pady=2)
@@ -406,10 +372,46 @@ class AIToolkitApp:
             command=self.save_settings,
         ).pack(pady=20)
     
+    def make_path_picker(
+        self,
+        parent: ttk.Frame,
+        var: tk.StringVar,
+        browse: Callable[[], None] | None = None,
+        width: int = 50,
+    ) -> ttk.Frame:
+        """
+        Path entry with a 📂 button, in a frame for the caller to pack
+        
+        browse defaults to browse_folder(var).
+        """
+        frame = ttk.Frame(parent)
+        
+        ttk.Entry(
+            frame,
+            textvariable=var,
+            width=width,
+        ).pack(side="left", fill="x", expand=True)
+        
+        ttk.Button(
+            frame,
+            text="📂",
+            command=browse or functools.partial(self.browse_folder, var),
+            width=3,
+        ).pack(side="left", padx=5)
+        
+        return frame
+    
     # ══════════════════════════════════════════════════════════════
     # Handlers
     # ══════════════════════════════════════════════════════════════
     
+    def on_tab_changed(self, event: tk.Event):
+        """Build a deferred tab on its first selection"""
+        tab = self.pending_tabs.pop(event.widget.select(), None)
+        if tab is not None:
+            frame, build = tab
+            build(frame)
+    
     def browse_path(self):
         """Select folder for project"""
         path = filedialog.askdirectory(initialdir=self.project_path.get())
@@ -431,7 +433,7 @@ class AIToolkitApp:
             messagebox.showerror("Error", "Enter project name")
             return
         
-        if not name.replace('_', '').replace('-', '').isalnum():
+        if not PROJECT_NAME.fullmatch(name):
             messagebox.showerror("Error", "Name: only letters, numbers, _ and -")
             return
         
@@ -441,38 +443,41 @@ class AIToolkitApp:
         
         # Set IDE
         ide = self.selected_ide.get()
-        cfg = IDE_CONFIGS[ide]
-        set_default_ide(ide, cfg["ai_targets"])
-        
-        # Create in separate thread
-        def create():
-            try:
-                result = create_project(
-                    name=name,
-                    path=path,
-                    template=self.selected_template.get(),
-                    ai_targets=cfg["ai_targets"],
-                    include_docker=self.include_docker.get(),
-                    include_ci=self.include_ci.get(),
-                    include_git=self.include_git.get(),
-                )
-                
-                if result:
-                    self.root.after(0, lambda: messagebox.showinfo(
-                        "Success",
-                        f"✅ Project {name} created!\n\n"
-                        f"Path: {path / name}\n\n"
-                        f"Next steps:\n"
-                        f"1. cd {path / name}\n"
-                        f"2. ./scripts/bootstrap.sh\n"
-                        f"3. source ../_venvs/{name}-venv/bin/activate"
-                    ))
-                else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Failed to create project"))
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
-        
-        threading.Thread(target=create, daemon=True).start()
+        ai_targets = IDE_TARGETS[ide]
+        set_default_ide(ide, ai_targets)
+        
+        # Create on the worker thread (Tk variables are read here, not there)
+        self.run_in_background(
+            functools.partial(
+                create_project,
+                name=name,
+                path=path,
+                template=self.selected_template.get(),
+                ai_targets=ai_targets,
+                include_docker=self.include_docker.get(),
+                include_ci=self.include_ci.get(),
+                include_git=self.include_git.get(),
+            ),
+            functools.partial(self.on_project_created, name, path),
+            self.create_button,
+        )
+    
+    def on_project_created(self, name: str, path: Path, result: bool, error: Exception | None):
+        """Report the result of do_create_project"""
+        if error is not None:
+            messagebox.showerror("Error", str(error))
+        elif result:
+            messagebox.showinfo(
+                "Success",
+                f"✅ Project {name} created!\n\n"
+                f"Path: {path / name}\n\n"
+                f"Next steps:\n"
+                f"1. cd {path / name}\n"
+                f"2. ./scripts/bootstrap.sh\n"
+                f"3. source ../_venvs/{name}-venv/bin/activate"
+            )
+        else:
+            messagebox.showerror("Error", "Failed to create project")
     
     def do_analyze(self):
         """Analyze project"""
@@ -484,14 +489,19 @@ class AIToolkitApp:
         
         self.cleanup_results.delete("1.0", "end")
         
-        issues = analyze_project(path)
-        
-        if not issues:
-            self.cleanup_results.insert("end", "✅ Project is clean! No issues found.\n")
+        self.run_in_background(functools.partial(analyze_project, path), self.on_analyzed, self.analyze_button)
+    
+    def on_analyzed(self, issues: list, error: Exception | None):
+        """Show the issues found by do_analyze"""
+        if error is not None:
+            messagebox.showerror("Error", str(error))
+        elif not issues:
+            append_bounded(self.cleanup_results, "✅ Project is clean! No issues found.\n")
         else:
-            self.cleanup_results.insert("end", f"Found {len(issues)} issues:\n\n")
-            for issue in issues:
-                self.cleanup_results.insert("end", f"  {issue}\n")
+            # One insert (one Tcl call) for the whole list
+            lines = [f"Found {len(issues)} issues:\n\n"]
+            lines.extend([f"  {issue}\n" for issue in issues])
+            append_bounded(self.cleanup_results, "".join(lines))
     
     def do_cleanup(self, level: str):
         """Cleanup project"""
@@ -504,9 +514,13 @@ class AIToolkitApp:
         if not messagebox.askyesno("Confirm", f"Clean {path.name}?\nLevel: {level}"):
             return
         
-        result = cleanup_project(path, level)
-        
-        if result:
+        self.run_in_background(functools.partial(cleanup_project, path, level), self.on_cleaned, self.cleanup_button)
+    
+    def on_cleaned(self, result: bool, error: Exception | None):
+        """Report the result of do_cleanup"""
+        if error is not None:
+            messagebox.showerror("Error", str(error))
+        elif result:
             messagebox.showinfo("Success", "Cleanup completed!")
             self.do_analyze()  # Update results
         else:
@@ -522,37 +536,117 @@ class AIToolkitApp:
         
         self.health_results.delete("1.0", "end")
         
-        # Capture output
-        import io
-        import sys
-        
-        old_stdout = sys.stdout
-        sys.stdout = buffer = io.StringIO()
-        
-        try:
-            result = health_check(path)
-        finally:
-            output = buffer.getvalue()
-            sys.stdout = old_stdout
-        
-        # Remove ANSI codes
-        import re
-        clean_output = re.sub(r'\x1b\[[0-9;]*m', '', output)
-        
-        self.health_results.insert("end", clean_output)
+        # The report streams in through output while the check runs
+        output: queue.Queue = queue.Queue()
+        self.run_in_background(functools.partial(stream_health_check, path, output), self.on_health_checked, self.check_button)
+        self.root.after(HEALTH_POLL_MS, self.drain_health_output, output)
+    
+    def drain_health_output(self, output: queue.Queue):
+        """Move the report written so far into the Health tab (one insert); stop at None"""
+        chunks = []
+        done = False
+        while True:
+            try:
+                chunk = output.get_nowait()
+            except queue.Empty:
+                break
+            if chunk is None:
+                done = True
+                break
+            chunks.append(chunk)
+        
+        if chunks:
+            append_bounded(self.health_results, "".join(chunks))
+        if not done:
+            self.root.after(HEALTH_POLL_MS, self.drain_health_output, output)
+    
+    def on_health_checked(self, result: bool, error: Exception | None):
+        """Report a failed do_health_check (the report itself streams in)"""
+        if error is not None:
+            messagebox.showerror("Error", str(error))
     
     def save_settings(self):
         """Save settings"""
         ide = self.selected_ide.get()
-        cfg = IDE_CONFIGS[ide]
-        set_default_ide(ide, cfg["ai_targets"])
-        messagebox.showinfo("Settings", f"IDE: {cfg['icon']} {cfg['name']}")
+        set_default_ide(ide, IDE_TARGETS[ide])
+        messagebox.showinfo("Settings", f"IDE: {IDE_LABELS[ide]}")
+    
+    # ══════════════════════════════════════════════════════════════
+    # Background jobs
+    # ══════════════════════════════════════════════════════════════
+    
+    def run_in_background(
+        self,
+        job: Callable[[], object],
+        on_done: Callable[[object, Exception | None], None],
+        button: ttk.Button,
+    ):
+        """
+        Queue job for the worker thread; on_done(result, error) then runs on the Tk thread
+        
+        button is disabled until then, so repeated clicks can't queue the same action twice.
+        """
+        button.state(["disabled"])
+        self.jobs.put((job, on_done, button))
+    
+    def worker(self):
+        """Worker thread: run queued jobs one at a time (never touches Tk)"""
+        while True:
+            job, on_done, button = self.jobs.get()
+            try:
+                self.results.put((on_done, button, job(), None))
+            except Exception as e:
+                self.results.put((on_done, button, None, e))
+    
+    def drain_results(self):
+        """Tk thread: pass finished jobs to their callbacks, then poll again"""
+        try:
+            while True:
+                try:
+                    on_done, button, result, error = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                button.state(["!disabled"])
+                on_done(result, error)
+        finally:
+            self.root.after(RESULT_POLL_MS, self.drain_results)
     
     def run(self):
         """Run application"""
         self.root.mainloop()
 
 
+def append_bounded(widget: tk.Text, text: str, max_lines: int = MAX_RESULT_LINES) -> None:
+    """Append text to widget, then trim its oldest lines beyond max_lines"""
+    widget.insert("end", text)
+    
+    last_line = int(widget.index("end-1c").split(".")[0])
+    if last_line > max_lines:
+        widget.delete("1.0", f"{last_line - max_lines + 1}.0")
+
+
+class QueueWriter:
+    """Text stream that puts every write() on a queue"""
+    
+    def __init__(self, output: queue.Queue):
+        self.output = output
+    
+    def write(self, text: str) -> int:
+        self.output.put(text)
+        return len(text)
+    
+    def flush(self) -> None:
+        pass
+
+
+def stream_health_check(path: Path, output: queue.Queue) -> bool:
+    """Run health_check, putting its plain-text report on output as it is written; None marks the end"""
+    try:
+        return health_check(path, writer=QueueWriter(output), color=False)
+    finally:
+        output.put(None)
+
+
 # ══════════════════════════════════════════════════════════════
 # Entry point
 # ══════════════════════════════════════════════════════════════
@@ -11,6 +11,7 @@ from pathlib import Path
 
 from .core.constants import COLORS, VERSION, IDE_CONFIGS
 from .core.config import set_default_ide, get_default_ide, get_default_ai_targets
+from .commands.pack import MAX_FILE_SIZE
 
 from .commands import (
     cmd_create,
@@ -204,6 +205,13 @@ def cli_mode():
     pack_p = subparsers.add_parser("pack", help="Pack project context to XML")
     pack_p.add_argument("path", type=Path, nargs="?", default=Path.cwd(), help="Project path")
     pack_p.add_argument("--output", "-o", default="context_dump.xml", help="Output file")
+    pack_p.add_argument(
+        "--max-bytes",
+        type=int,
+        default=MAX_FILE_SIZE,
+        dest="max_bytes",
+        help=f"Skip files larger than this many bytes (default: {MAX_FILE_SIZE})"
+    )
     
     # trace
     trace_p = subparsers.add_parser("trace", help="Trace file dependencies (AST)")
@@ -284,7 +292,7 @@ def cli_mode():
         for issue in issues:
             print(f"   {issue}")
         if args.level != "safe":
-            cleanup_project(args.path, args.level)
+            cleanup_project(args.path, args.level, issues)
     
     elif args.command == "migrate":
         migrate_project(args.path, args.ai)
@@ -305,7 +313,7 @@ def cli_mode():
         cmd_hooks()
     
     elif args.command == "pack":
-        success, files_count, size = pack_context(args.path, args.output)
+        success, files_count, size = pack_context(args.path, args.output, args.max_bytes)
         if success:
             print(COLORS.success(f"Packed {files_count} files ({size:,} bytes) to {args.output}"))
     
@@ -4,15 +4,19 @@ Cleanup command - clean dirty projects
 
 from __future__ import annotations
 
-import shutil
-import tarfile
+import errno
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from ..core.constants import COLORS, CLEANUP_LEVELS
 from ..core.file_utils import get_dir_size
 
+if TYPE_CHECKING:
+    import tarfile
+
 
 @dataclass
 class Issue:
@@ -23,6 +27,7 @@ class Issue:
     size_mb: float
     message: str
     fix_action: str
+    paths: list[str] = field(default_factory=list)  # every target, e.g. all __pycache__
     
     def __str__(self) -> str:
         icons = {"error": "[ERROR]", "warning": "[WARN]", "info": "[INFO]"}
@@ -30,76 +35,178 @@ class Issue:
         return f"{icons.get(self.severity, '*')} {self.message}{size}"
 
 
+VENV_NAMES = ("venv", ".venv", "env")
+
+
+@dataclass
+class ProjectScan:
+    """Everything analyze_project needs, collected in a single walk"""
+    venvs: list[Path] = field(default_factory=list)
+    site_packages: list[Path] = field(default_factory=list)
+    logs: list[tuple[Path, float]] = field(default_factory=list)  # (file, size MB)
+    data_size_mb: float | None = None  # None if there is no data/
+    pycache: list[str] = field(default_factory=list)  # DirEntry.path, only counted by analyze
+
+
+def _is_venv(path: str | Path) -> bool:
+    """True if path has a bin/ (POSIX) or Scripts/ (Windows) subfolder"""
+    try:
+        with os.scandir(path) as it:
+            return any(
+                entry.name in ("bin", "Scripts") and entry.is_dir(follow_symlinks=False)
+                for entry in it
+            )
+    except OSError:
+        return False
+
+
+def scan_project(project_path: Path) -> ProjectScan:
+    """
+    Walk the project once with os.scandir
+    
+    Top-level venvs, site-packages and __pycache__ folders are recorded
+    but not descended into; data/ sizes and logs/*.log sizes are
+    accumulated on the way from the cached DirEntry data. The walk
+    itself stays on str paths; Path objects are only built for the venvs,
+    site-packages and logs that get reported (__pycache__ is just counted).
+    """
+    scan = ProjectScan()
+    data_bytes = 0
+    logs_dir = os.path.join(project_path, "logs")
+    
+    # (directory, name of its top-level ancestor or None for the root)
+    stack: list[tuple[str, str | None]] = [(os.fspath(project_path), None)]
+    while stack:
+        current, top = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        
+        with it:
+            for entry in it:
+                try:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if top is None:
+                            if name == "data":
+                                scan.data_size_mb = 0.0
+                            if name in VENV_NAMES and _is_venv(entry.path):
+                                scan.venvs.append(Path(entry.path))
+                                continue
+                        if name == "site-packages":
+                            scan.site_packages.append(Path(entry.path))
+                            continue
+                        if name == "__pycache__":
+                            scan.pycache.append(entry.path)
+                            continue
+                        stack.append((entry.path, top or name))
+                    elif top == "data":
+                        data_bytes += entry.stat(follow_symlinks=False).st_size
+                    elif (current == logs_dir and name.endswith(".log")
+                          and entry.is_file(follow_symlinks=False)):
+                        size = entry.stat(follow_symlinks=False).st_size / (1024 * 1024)
+                        scan.logs.append((Path(entry.path), size))
+                except OSError:
+                    continue
+    
+    if scan.data_size_mb is not None:
+        scan.data_size_mb = data_bytes / (1024 * 1024)
+    return scan
+
+
+def _map_io(func, items: list) -> list:
+    """
+    Map an I/O-bound func over items on a thread pool
+    
+    Runs inline for fewer than two items. The pool is kept small on
+    Windows, where concurrent deletes tend to hit PermissionError.
+    """
+    if len(items) < 2:
+        return [func(item) for item in items]
+    
+    workers = 4 if os.name == "nt" else min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        return list(pool.map(func, items))
+
+
+def _remove_pycache(path: str) -> None:
+    """Remove a __pycache__ folder: unlink its (normally flat) files, then rmdir"""
+    import shutil
+    
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(path)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+
+
 def analyze_project(project_path: Path) -> list[Issue]:
     """Analyze project for issues"""
     issues: list[Issue] = []
+    scan = scan_project(project_path)
+    sizes = _map_io(get_dir_size, scan.venvs + scan.site_packages)
     
     # 1. venv inside project
-    for venv_name in ["venv", ".venv", "env"]:
-        venv_path = project_path / venv_name
-        if venv_path.is_dir() and (venv_path / "bin").exists():
-            size = get_dir_size(venv_path)
-            issues.append(Issue(
-                type="venv",
-                severity="error",
-                path=venv_path,
-                size_mb=size,
-                message=f"Found {venv_name}/ inside project",
-                fix_action=f"move:../_venvs/{project_path.name}-venv"
-            ))
+    for venv_path, size in zip(scan.venvs, sizes):
+        issues.append(Issue(
+            type="venv",
+            severity="error",
+            path=venv_path,
+            size_mb=size,
+            message=f"Found {venv_path.name}/ inside project",
+            fix_action=f"move:../_venvs/{project_path.name}-venv"
+        ))
     
     # 2. site-packages
-    for sp in project_path.rglob("site-packages"):
-        if sp.is_dir():
-            size = get_dir_size(sp)
-            issues.append(Issue(
-                type="venv",
-                severity="error",
-                path=sp,
-                size_mb=size,
-                message="Found site-packages/",
-                fix_action="delete"
-            ))
+    for sp, size in zip(scan.site_packages, sizes[len(scan.venvs):]):
+        issues.append(Issue(
+            type="venv",
+            severity="error",
+            path=sp,
+            size_mb=size,
+            message="Found site-packages/",
+            fix_action="delete"
+        ))
     
     # 3. Large logs
-    logs_dir = project_path / "logs"
-    if logs_dir.exists():
-        for log_file in logs_dir.glob("*.log"):
-            size = log_file.stat().st_size / (1024 * 1024)
-            if size > 10:
-                issues.append(Issue(
-                    type="logs",
-                    severity="warning",
-                    path=log_file,
-                    size_mb=size,
-                    message=f"Large log: {log_file.name}",
-                    fix_action="truncate:1000"
-                ))
-    
-    # 4. Large data
-    data_dir = project_path / "data"
-    if data_dir.exists():
-        size = get_dir_size(data_dir)
-        if size > 100:
+    for log_file, size in scan.logs:
+        if size > 10:
             issues.append(Issue(
-                type="data",
+                type="logs",
                 severity="warning",
-                path=data_dir,
+                path=log_file,
                 size_mb=size,
-                message="Large data/ folder",
-                fix_action=f"move:../_data/{project_path.name}"
+                message=f"Large log: {log_file.name}",
+                fix_action="truncate:1000"
             ))
     
+    # 4. Large data
+    if scan.data_size_mb is not None and scan.data_size_mb > 100:
+        issues.append(Issue(
+            type="data",
+            severity="warning",
+            path=project_path / "data",
+            size_mb=scan.data_size_mb,
+            message="Large data/ folder",
+            fix_action=f"move:../_data/{project_path.name}"
+        ))
+    
     # 5. __pycache__
-    pycache_count = len(list(project_path.rglob("__pycache__")))
-    if pycache_count > 0:
+    if scan.pycache:
         issues.append(Issue(
             type="cache",
             severity="info",
             path=None,
             size_mb=0,
-            message=f"Found {pycache_count} __pycache__ folders",
-            fix_action="delete_all"
+            message=f"Found {len(scan.pycache)} __pycache__ folders",
+            fix_action="delete_all",
+            paths=scan.pycache,
         ))
     
     # 6. Missing configs
@@ -124,44 +231,157 @@ def analyze_project(project_path: Path) -> list[Issue]:
     return issues
 
 
+# Menu order for select_cleanup_level()
+LEVEL_LIST = list(CLEANUP_LEVELS.items())
+
+
 def select_cleanup_level() -> str:
     """Select cleanup level"""
     print("\nSelect cleanup level:\n")
     
-    levels = list(CLEANUP_LEVELS.items())
-    for i, (name, level) in enumerate(levels, 1):
+    for i, (name, level) in enumerate(LEVEL_LIST, 1):
         print(f"  {i}. {level['name']} - {level['description']}")
     
     while True:
-        choice = input(f"\nChoice (1-{len(levels)}): ").strip()
+        choice = input(f"\nChoice (1-{len(LEVEL_LIST)}): ").strip()
         try:
             idx = int(choice) - 1
-            if 0 <= idx < len(levels):
-                return levels[idx][0]
+            if 0 <= idx < len(LEVEL_LIST):
+                return LEVEL_LIST[idx][0]
         except ValueError:
             pass
         print("  Invalid choice")
 
 
-def create_backup(project_path: Path) -> Path:
-    """Create backup"""
+def _tail_lines(path: Path, n: int, block_size: int = 65536) -> bytes:
+    """Return the last n lines of a file, reading backwards in blocks"""
+    chunks: list[bytes] = []
+    newlines = 0
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        # n + 1 newlines: the file's own trailing newline ends the last line
+        while pos > 0 and newlines <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    
+    data = b"".join(reversed(chunks))
+    start = len(data) - 1 if data.endswith(b"\n") else len(data)
+    for _ in range(n):
+        start = data.rfind(b"\n", 0, start)
+        if start == -1:
+            return data
+    return data[start + 1:]
+
+
+# Directories never worth archiving: rebuilt, regenerated or moved by cleanup
+BACKUP_SKIP_DIRS = frozenset({
+    "venv", ".venv", "env", "__pycache__", "node_modules",
+    ".git", "site-packages", "_venvs",
+})
+
+# Write-side buffer for the backup archive
+BACKUP_BUFSIZE = 1024 * 1024
+
+
+def _add_tree(tar: tarfile.TarFile, path: str, arcname: str) -> None:
+    """
+    tar.add(path) for a directory, tolerant of concurrent cleanup
+    
+    BACKUP_SKIP_DIRS are pruned by name before anything in them is stat'ed,
+    and entries that vanish between listing and archiving are skipped:
+    cleanup_project moves venvs and removes __pycache__ while this runs.
+    """
+    tar.add(path, arcname=arcname, recursive=False)
+    try:
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except FileNotFoundError:
+        return
+    
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in BACKUP_SKIP_DIRS:
+                    _add_tree(tar, entry.path, f"{arcname}/{entry.name}")
+            else:
+                tar.add(entry.path, arcname=f"{arcname}/{entry.name}", recursive=False)
+        except FileNotFoundError:
+            continue
+
+
+def create_backup(project_path: Path, log: list[str] | None = None) -> Path:
+    """
+    Create backup
+    
+    Args:
+        project_path: Project root
+        log: Collect the progress lines here instead of printing them
+            (for a caller running this on another thread)
+    """
+    # Backup-only imports: tarfile alone drags in gzip/bz2/lzma
+    import gzip
+    import shutil
+    import subprocess
+    import tarfile
+    from datetime import datetime
+    
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_name = f"{project_path.name}_backup_{timestamp}.tar.gz"
     backup_path = project_path.parent / backup_name
     
-    print(f"\n{COLORS.colorize(f'Creating backup: {backup_name}', COLORS.CYAN)}")
-    
-    with tarfile.open(backup_path, "w:gz") as tar:
-        tar.add(project_path, arcname=project_path.name)
+    echo = print if log is None else log.append
+    echo(f"\n{COLORS.colorize(f'Creating backup: {backup_name}', COLORS.CYAN)}")
+    
+    try:
+        # pigz compresses on all cores and writes the same .tar.gz format
+        pigz = shutil.which("pigz")
+        if pigz:
+            with open(backup_path, "wb") as out:
+                proc = subprocess.Popen([pigz, "-c"], stdin=subprocess.PIPE, stdout=out)
+                try:
+                    with tarfile.open(fileobj=proc.stdin, mode="w|", bufsize=BACKUP_BUFSIZE) as tar:
+                        _add_tree(tar, str(project_path), project_path.name)
+                finally:
+                    proc.stdin.close()
+                    returncode = proc.wait()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, [pigz, "-c"])
+        else:
+            # Transient pre-cleanup archive: favour speed over ratio, and stream
+            # through 1 MiB buffers instead of tarfile's 10 KiB records
+            with open(backup_path, "wb", buffering=BACKUP_BUFSIZE) as fh, \
+                    gzip.GzipFile(fileobj=fh, mode="wb", compresslevel=1) as gz, \
+                    tarfile.open(fileobj=gz, mode="w|", bufsize=BACKUP_BUFSIZE) as tar:
+                _add_tree(tar, str(project_path), project_path.name)
+    except BaseException:
+        # A truncated archive must not pass for a backup
+        backup_path.unlink(missing_ok=True)
+        raise
     
     size = backup_path.stat().st_size / (1024 * 1024)
-    print(f"  {COLORS.success(f'Backup created ({size:.1f} MB)')}")
+    echo(f"  {COLORS.success(f'Backup created ({size:.1f} MB)')}")
     
     return backup_path
 
 
-def cleanup_project(project_path: Path, level: str) -> bool:
-    """Run cleanup"""
+def cleanup_project(
+    project_path: Path,
+    level: str,
+    issues: list[Issue] | None = None,
+) -> bool:
+    """
+    Run cleanup
+    
+    Args:
+        project_path: Project root
+        level: Key of CLEANUP_LEVELS
+        issues: Result of analyze_project() for this project, if the caller
+            already has it; the project is analyzed (once) otherwise
+    """
     level_config = CLEANUP_LEVELS.get(level)
     if not level_config:
         print(COLORS.error(f"Unknown level: {level}"))
@@ -177,46 +397,71 @@ def cleanup_project(project_path: Path, level: str) -> bool:
         print(f"\n{COLORS.warning('Safe mode - no changes')}")
         return True
     
-    # Backup
+    import shutil
+    
+    if issues is None:
+        issues = analyze_project(project_path)
+    
+    # Backup, in the background: the archive skips venvs and __pycache__
+    # (BACKUP_SKIP_DIRS), so it can be written while those are handled.
+    # Its progress is printed after the join, not amid the venv output
+    backup = None
+    backup_log: list[str] = []
     if "backup" in actions:
-        create_backup(project_path)
+        pool = ThreadPoolExecutor(max_workers=1)
+        backup = pool.submit(create_backup, project_path, backup_log)
+        pool.shutdown(wait=False)
     
     freed_mb = 0.0
     
     # Move venv
     if "move_venv" in actions:
-        for venv_name in ["venv", ".venv", "env"]:
-            venv_path = project_path / venv_name
-            if venv_path.is_dir() and (venv_path / "bin").exists():
-                size = get_dir_size(venv_path)
-                venvs_dir = project_path.parent / "_venvs"
-                venvs_dir.mkdir(exist_ok=True)
-                new_path = venvs_dir / f"{project_path.name}-venv"
-                
-                if new_path.exists():
-                    print(f"  {COLORS.warning(f'{new_path} exists, deleting old venv')}")
-                    shutil.rmtree(venv_path)
-                else:
-                    print(f"  {COLORS.colorize(f'Moving {venv_name}/ -> {new_path}', COLORS.CYAN)}")
+        for issue in issues:
+            if issue.type != "venv" or not issue.fix_action.startswith("move:"):
+                continue
+            venv_path = issue.path
+            venvs_dir = project_path.parent / "_venvs"
+            venvs_dir.mkdir(exist_ok=True)
+            new_path = venvs_dir / f"{project_path.name}-venv"
+            
+            if new_path.exists():
+                print(f"  {COLORS.warning(f'{new_path} exists, deleting old venv')}")
+                shutil.rmtree(venv_path)
+            else:
+                print(f"  {COLORS.colorize(f'Moving {venv_path.name}/ -> {new_path}', COLORS.CYAN)}")
+                try:
+                    os.rename(venv_path, new_path)
+                except OSError as err:
+                    if err.errno != errno.EXDEV:
+                        raise
+                    # _venvs/ is on another filesystem: copy + delete
                     shutil.move(str(venv_path), str(new_path))
-                
-                freed_mb += size
+            
+            freed_mb += issue.size_mb
     
     # Delete __pycache__
-    for pycache in project_path.rglob("__pycache__"):
-        shutil.rmtree(pycache, ignore_errors=True)
+    for issue in issues:
+        if issue.type == "cache":
+            _map_io(_remove_pycache, issue.paths)
+    
+    # Everything below rewrites archived files
+    if backup is not None:
+        try:
+            backup.result()
+        except Exception as err:
+            print("\n".join(backup_log))
+            print(f"  {COLORS.error(f'Backup failed ({err}), stopping before logs and configs')}")
+            return False
+        print("\n".join(backup_log))
     
     # Clean logs
     if "move_data" in actions:
-        logs_dir = project_path / "logs"
-        if logs_dir.exists():
-            for log_file in logs_dir.glob("*.log"):
-                size = log_file.stat().st_size / (1024 * 1024)
-                if size > 10:
-                    lines = log_file.read_text(errors="ignore").splitlines()
-                    log_file.write_text("\n".join(lines[-1000:]))
-                    print(f"  {COLORS.colorize(f'Cleaned {log_file.name}', COLORS.CYAN)}")
-                    freed_mb += size * 0.9
+        for issue in issues:
+            if issue.type == "logs" and issue.fix_action.startswith("truncate:"):
+                keep = int(issue.fix_action.split(":", 1)[1])
+                issue.path.write_bytes(_tail_lines(issue.path, keep))
+                print(f"  {COLORS.colorize(f'Cleaned {issue.path.name}', COLORS.CYAN)}")
+                freed_mb += issue.size_mb * 0.9
     
     # Create configs
     if "create_configs" in actions:
@@ -225,25 +470,37 @@ def cleanup_project(project_path: Path, level: str) -> bool:
         migrate_project(project_path, ["cursor", "copilot", "claude"], quiet=True)
     
     print(f"""
-{COLORS.colorize('=' * 50, COLORS.GREEN)}
+{COLORS.SEP_GREEN_50}
 {COLORS.success('Cleanup complete!')}
-{COLORS.colorize('=' * 50, COLORS.GREEN)}
+{COLORS.SEP_GREEN_50}
    Freed: ~{freed_mb:.1f} MB
 """)
     
     return True
 
 
-def cmd_cleanup() -> None:
-    """Interactive cleanup command"""
+def cmd_cleanup(path: Path | None = None, level: str | None = None) -> None:
+    """
+    Interactive cleanup command
+    
+    Args:
+        path: Project path; prompted for if not given
+        level: Key of CLEANUP_LEVELS; prompted for if not given
+    """
     print(COLORS.colorize("\nCLEANUP PROJECT\n", COLORS.GREEN))
     
-    path_str = input("Project path: ").strip()
-    if not path_str:
-        print(COLORS.warning("Cancelled"))
+    if level is not None and level not in CLEANUP_LEVELS:
+        print(COLORS.error(f"Unknown level: {level}"))
         return
     
-    path = Path(path_str).resolve()
+    if path is None:
+        path_str = input("Project path: ").strip()
+        if not path_str:
+            print(COLORS.warning("Cancelled"))
+            return
+        path = Path(path_str)
+    
+    path = path.resolve()
     if not path.exists():
         print(COLORS.error(f"Path does not exist: {path}"))
         return
@@ -262,7 +519,8 @@ def cmd_cleanup() -> None:
         print(f"   {issue}")
     
     # Select level
-    level = select_cleanup_level()
+    if level is None:
+        level = select_cleanup_level()
     
     if level == "safe":
         print(f"\n{COLORS.warning('Safe mode - recommendations only')}")
@@ -274,4 +532,4 @@ def cmd_cleanup() -> None:
         print(COLORS.warning("Cancelled"))
         return
     
-    cleanup_project(path, level)
+    cleanup_project(path, level, issues)
@@ -4,12 +4,15 @@ Create command - create new project
 
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
-from datetime import datetime
+import datetime
+from string import Template
 
-from ..core.constants import COLORS, TEMPLATES, VERSION
+from ..core.constants import COLORS, TEMPLATES, TEMPLATE_IDS, TEMPLATE_MODULES, VERSION
 from ..core.config import get_config, get_default_ide, get_default_ai_targets
-from ..core.file_utils import create_file
+from ..core.file_utils import WriteQueue, make_dirs
 
 from ..generators import (
     generate_ai_configs,
@@ -21,36 +24,34 @@ from ..generators import (
 )
 
 
-def select_template() -> str:
-    """Interactive template selection"""
-    print("\nSelect template:\n")
-    
-    templates = list(TEMPLATES.items())
-    for i, (name, tmpl) in enumerate(templates, 1):
-        icon = tmpl.get("icon", "")
-        desc = tmpl.get("description", "")
-        print(f"  {i}. [{icon}] {tmpl['name']} - {desc}")
-    
-    while True:
-        choice = input(f"\nChoice (1-{len(templates)}): ").strip()
-        try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(templates):
-                return templates[idx][0]
-        except ValueError:
-            pass
-        print("  Invalid choice")
+BOT_DIRS = ("bot/handlers", "bot/keyboards", "bot/utils", "bot/middlewares")
 
+# Directories each TEMPLATES module writes into
+MODULE_DIRS = {
+    "bot": BOT_DIRS,
+    "handlers": BOT_DIRS,
+    "database": ("database",),
+    "api": ("api",),
+    "webapp": ("webapp",),
+    "parser": ("parser",),
+}
+
+# Directories every project gets
+BASE_DIRS = ("_AI_INCLUDE", "scripts", "logs", "data", "tests")
+
+
+def scaffold_dirs(template: str, include_ci: bool = True) -> set[str]:
+    """Every directory create_project() will write into, for make_dirs()"""
+    dirs = set(BASE_DIRS)
+    for module in TEMPLATE_MODULES.get(template, ()):
+        dirs.update(MODULE_DIRS.get(module, ()))
+    if include_ci:
+        dirs.add(".github/workflows")
+    return dirs
 
-def generate_bot_module(project_dir: Path, project_name: str) -> None:
-    """Generate bot module"""
-    
-    for d in ["bot/handlers", "bot/keyboards", "bot/utils", "bot/middlewares"]:
-        (project_dir / d).mkdir(parents=True, exist_ok=True)
-    
-    create_file(project_dir / "bot/__init__.py", '"""Bot package"""')
-    
-    main_content = f'''"""Telegram Bot - {project_name}"""
+
+# Module file bodies, built once at import
+_BOT_MAIN_TPL = Template('''"""Telegram Bot - $project_name"""
 
 import asyncio
 import logging
@@ -92,19 +93,17 @@ async def main():
 
 if __name__ == "__main__":
     asyncio.run(main())
-'''
-    create_file(project_dir / "bot/main.py", main_content)
-    
-    handlers_init = '''"""Handlers"""
+''')
+
+_BOT_HANDLERS_INIT = '''"""Handlers"""
 from aiogram import Dispatcher
 from .start import router as start_router
 
 def setup_handlers(dp: Dispatcher) -> None:
     dp.include_router(start_router)
 '''
-    create_file(project_dir / "bot/handlers/__init__.py", handlers_init)
-    
-    start_content = '''"""Start handler"""
+
+_BOT_START_HANDLER = '''"""Start handler"""
 from aiogram import Router
 from aiogram.filters import CommandStart, Command
 from aiogram.types import Message
@@ -119,18 +118,8 @@ async def cmd_start(message: Message):
 async def cmd_help(message: Message):
     await message.answer("/start - Start\\n/help - Help")
 '''
-    create_file(project_dir / "bot/handlers/start.py", start_content)
-    
-    for pkg in ["keyboards", "utils", "middlewares"]:
-        create_file(project_dir / f"bot/{pkg}/__init__.py", f'"""{pkg}"""')
 
-
-def generate_database_module(project_dir: Path) -> None:
-    """Generate database module"""
-    (project_dir / "database").mkdir(exist_ok=True)
-    create_file(project_dir / "database/__init__.py", '"""Database"""')
-    
-    db_content = '''"""Database operations"""
+_DATABASE_DB = '''"""Database operations"""
 import aiosqlite
 from config import settings
 
@@ -153,49 +142,32 @@ async def get_user(telegram_id: int):
         async with db.execute("SELECT * FROM users WHERE telegram_id = ?", (telegram_id,)) as cur:
             return await cur.fetchone()
 '''
-    create_file(project_dir / "database/db.py", db_content)
-
 
-def generate_api_module(project_dir: Path, project_name: str, template: str) -> None:
-    """Generate API module"""
-    (project_dir / "api").mkdir(exist_ok=True)
-    create_file(project_dir / "api/__init__.py", '"""API"""')
-    
-    if template == "fastapi":
-        content = f'''"""FastAPI - {project_name}"""
+_API_FASTAPI_TPL = Template('''"""FastAPI - $project_name"""
 from fastapi import FastAPI
 from config import settings
 
-app = FastAPI(title="{project_name}", debug=settings.debug)
+app = FastAPI(title="$project_name", debug=settings.debug)
 
 @app.get("/")
 async def root():
-    return {{"message": "Hello!"}}
+    return {"message": "Hello!"}
 
 @app.get("/health")
 async def health():
-    return {{"status": "ok"}}
-'''
-    else:
-        content = '"""API - TODO"""'
-    
-    create_file(project_dir / "api/main.py", content)
-
+    return {"status": "ok"}
+''')
 
-def generate_webapp_module(project_dir: Path, project_name: str) -> None:
-    """Generate WebApp module"""
-    (project_dir / "webapp").mkdir(exist_ok=True)
-    
-    html = f'''<!DOCTYPE html>
+_WEBAPP_HTML_TPL = Template('''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{project_name}</title>
+    <title>$project_name</title>
     <script src="https://telegram.org/js/telegram-web-app.js"></script>
 </head>
 <body>
-    <h1>{project_name}</h1>
+    <h1>$project_name</h1>
     <script>
         const tg = window.Telegram.WebApp;
         tg.ready();
@@ -203,16 +175,9 @@ def generate_webapp_module(project_dir: Path, project_name: str) -> None:
     </script>
 </body>
 </html>
-'''
-    create_file(project_dir / "webapp/index.html", html)
-
+''')
 
-def generate_parser_module(project_dir: Path) -> None:
-    """Generate parser module"""
-    (project_dir / "parser").mkdir(exist_ok=True)
-    create_file(project_dir / "parser/__init__.py", '"""Parser"""')
-    
-    content = '''"""Web Parser"""
+_PARSER_SCRAPER = '''"""Web Parser"""
 import httpx
 from bs4 import BeautifulSoup
 
@@ -224,26 +189,107 @@ async def fetch_page(url: str) -> str:
 def parse_html(html: str) -> BeautifulSoup:
     return BeautifulSoup(html, "lxml")
 '''
-    create_file(project_dir / "parser/scraper.py", content)
 
 
-def generate_module_files(project_dir: Path, project_name: str, template: str) -> None:
-    """Generate module files"""
-    tmpl = TEMPLATES.get(template, {})
-    modules = tmpl.get("modules", [])
+def select_template() -> str:
+    """Interactive template selection"""
+    menu = [
+        f"  {i}. [{tmpl.get('icon', '')}] {tmpl['name']} - {tmpl.get('description', '')}"
+        for i, tmpl in enumerate(TEMPLATES.values(), 1)
+    ]
+    print("\nSelect template:\n\n" + "\n".join(menu))
+    
+    while True:
+        choice = input(f"\nChoice (1-{len(TEMPLATE_IDS)}): ").strip()
+        try:
+            idx = int(choice) - 1
+            if 0 <= idx < len(TEMPLATE_IDS):
+                return TEMPLATE_IDS[idx]
+        except ValueError:
+            pass
+        print("  Invalid choice")
+
+
+def generate_bot_module(project_dir: Path, project_name: str, queue: WriteQueue) -> None:
+    """Generate bot module (queued)"""
+    root = os.fspath(project_dir)
+    queue.add(f"{root}/bot/__init__.py", '"""Bot package"""')
+    
+    main_content = _BOT_MAIN_TPL.substitute(project_name=project_name)
+    queue.add(f"{root}/bot/main.py", main_content)
+    
+    queue.add(f"{root}/bot/handlers/__init__.py", _BOT_HANDLERS_INIT)
+    queue.add(f"{root}/bot/handlers/start.py", _BOT_START_HANDLER)
+    
+    for pkg in ["keyboards", "utils", "middlewares"]:
+        queue.add(f"{root}/bot/{pkg}/__init__.py", f'"""{pkg}"""')
+
+
+def generate_database_module(project_dir: Path, queue: WriteQueue) -> None:
+    """Generate database module (queued)"""
+    root = os.fspath(project_dir)
+    queue.add(f"{root}/database/__init__.py", '"""Database"""')
+    queue.add(f"{root}/database/db.py", _DATABASE_DB)
+
+
+def generate_api_module(
+    project_dir: Path, project_name: str, template: str, queue: WriteQueue
+) -> None:
+    """Generate API module (queued)"""
+    root = os.fspath(project_dir)
+    queue.add(f"{root}/api/__init__.py", '"""API"""')
     
-    print(f"\n{COLORS.colorize('Modules...', COLORS.CYAN)}")
+    if template == "fastapi":
+        content = _API_FASTAPI_TPL.substitute(project_name=project_name)
+    else:
+        content = '"""API - TODO"""'
+    
+    queue.add(f"{root}/api/main.py", content)
+
+
+def generate_webapp_module(project_dir: Path, project_name: str, queue: WriteQueue) -> None:
+    """Generate WebApp module (queued)"""
+    root = os.fspath(project_dir)
+    html = _WEBAPP_HTML_TPL.substitute(project_name=project_name)
+    queue.add(f"{root}/webapp/index.html", html)
+
+
+def generate_parser_module(project_dir: Path, queue: WriteQueue) -> None:
+    """Generate parser module (queued)"""
+    root = os.fspath(project_dir)
+    queue.add(f"{root}/parser/__init__.py", '"""Parser"""')
+    queue.add(f"{root}/parser/scraper.py", _PARSER_SCRAPER)
+
+
+def generate_module_files(
+    project_dir: Path, project_name: str, template: str, queue: WriteQueue
+) -> None:
+    """
+    Generate module files (directories come from scaffold_dirs())
+    
+    The module generators only build content; every module's files are
+    written together, concurrently, when the queue is flushed.
+    """
+    modules = TEMPLATE_MODULES.get(template, frozenset())
+    
+    queue.echo(f"\n{COLORS.colorize('Modules...', COLORS.CYAN)}")
     
     if "bot" in modules or "handlers" in modules:
-        generate_bot_module(project_dir, project_name)
+        generate_bot_module(project_dir, project_name, queue)
     if "database" in modules:
-        generate_database_module(project_dir)
+        generate_database_module(project_dir, queue)
     if "api" in modules:
-        generate_api_module(project_dir, project_name, template)
+        generate_api_module(project_dir, project_name, template, queue)
     if "webapp" in modules:
-        generate_webapp_module(project_dir, project_name)
+        generate_webapp_module(project_dir, project_name, queue)
     if "parser" in modules:
-        generate_parser_module(project_dir)
+        generate_parser_module(project_dir, queue)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_manifesto_bytes(src: Path) -> bytes:
+    """Manifesto contents, read once per session however many projects are created"""
+    return src.read_bytes()
 
 
 def create_project(
@@ -273,18 +319,21 @@ def create_project(
         ai_targets = get_default_ai_targets()
     
     project_dir = path / name
-    date = datetime.now().strftime("%Y-%m-%d")
+    date = datetime.date.today().isoformat()
     
-    if project_dir.exists():
+    # mkdir itself is the existence check
+    try:
+        project_dir.mkdir(parents=True)
+    except FileExistsError:
         print(f"{COLORS.error(f'Folder already exists: {project_dir}')}")
         return False
     
     tmpl = TEMPLATES.get(template, {})
     
     print(f"""
-{COLORS.colorize('=' * 60, COLORS.CYAN)}
+{COLORS.SEP_CYAN_60}
 {COLORS.colorize(f'Creating project: {name}', COLORS.CYAN)}
-{COLORS.colorize('=' * 60, COLORS.CYAN)}
+{COLORS.SEP_CYAN_60}
 Path: {project_dir}
 Template: [{tmpl.get('icon', '')}] {tmpl.get('name', template)}
 AI: {', '.join(ai_targets)}
@@ -293,28 +342,34 @@ CI/CD: {'Yes' if include_ci else 'No'}
 Git: {'Yes' if include_git else 'No'}
 """)
     
-    # Create directory
-    project_dir.mkdir(parents=True)
+    # Create directory tree up front, one mkdir per directory
+    make_dirs(project_dir, scaffold_dirs(template, include_ci))
+    
+    # Every stage is queued, then written in one batch with its progress
+    queue = WriteQueue(root=project_dir, skip_parent_mkdir=True)
     
     # AI configs
-    generate_ai_configs(project_dir, name, ai_targets, date)
+    generate_ai_configs(project_dir, name, ai_targets, date, queue)
+    queue.flush()
     
     # Scripts
-    generate_scripts(project_dir, name)
+    generate_scripts(project_dir, name, queue)
+    queue.flush()
     
     # Project files
-    generate_project_files(project_dir, name, template)
-    
-    # Module files
-    generate_module_files(project_dir, name, template)
+    generate_project_files(project_dir, name, template, queue)
+    queue.flush()
     
-    # Docker
+    # Module and Docker files
+    generate_module_files(project_dir, name, template, queue)
     if include_docker:
-        generate_docker_files(project_dir, name, template)
+        generate_docker_files(project_dir, name, template, queue)
+    queue.flush()
     
     # CI/CD
     if include_ci:
-        generate_ci_files(project_dir, name)
+        generate_ci_files(project_dir, name, queue)
+        queue.flush()
     
     # Git
     if include_git:
@@ -324,15 +379,18 @@ Git: {'Yes' if include_git else 'No'}
     if include_manifesto:
         toolkit_dir = Path(__file__).parent.parent.parent
         manifesto_src = toolkit_dir / "docs" / "manifesto.md"
-        if manifesto_src.exists():
-            import shutil
-            shutil.copy(manifesto_src, project_dir / "_AI_INCLUDE" / "FULL_MANIFESTO.md")
+        try:
+            manifesto = _load_manifesto_bytes(manifesto_src)
+        except FileNotFoundError:
+            pass  # toolkit installed without docs/
+        else:
+            (project_dir / "_AI_INCLUDE" / "FULL_MANIFESTO.md").write_bytes(manifesto)
             print(f"  {COLORS.success('_AI_INCLUDE/FULL_MANIFESTO.md')}")
     
     print(f"""
-{COLORS.colorize('=' * 60, COLORS.GREEN)}
+{COLORS.SEP_GREEN_60}
 {COLORS.colorize('Project created!', COLORS.GREEN)}
-{COLORS.colorize('=' * 60, COLORS.GREEN)}
+{COLORS.SEP_GREEN_60}
 
 Next steps:
 
@@ -346,11 +404,26 @@ Next steps:
     return True
 
 
-def cmd_create() -> None:
-    """Interactive create command"""
-    from ..core.config import get_default_ide
+def _ask_yes(prompt: str) -> bool:
+    """Y/n question, yes unless answered n"""
+    return input(prompt).strip().lower() != 'n'
+
+
+def cmd_create(
+    name: str | None = None,
+    path: Path | None = None,
+    template: str | None = None,
+    include_docker: bool | None = None,
+    include_ci: bool | None = None,
+    include_git: bool | None = None,
+) -> None:
+    """
+    Interactive create command
     
-    print(COLORS.colorize("\nCREATE NEW PROJECT\n", COLORS.GREEN))
+    Anything passed in is not asked for; the final confirmation is only
+    asked when something was prompted.
+    """
+    from ..core.config import get_default_ide
     
     # Show IDE
     ide = get_default_ide()
@@ -361,10 +434,15 @@ def cmd_create() -> None:
         "windsurf": "[WS] Windsurf",
         "all": "[ALL] Universal",
     }
-    print(f"  IDE: {ide_names.get(ide, ide)}\n")
+    print(COLORS.colorize("\nCREATE NEW PROJECT\n", COLORS.GREEN)
+          + f"\n  IDE: {ide_names.get(ide, ide)}\n")
+    
+    prompted = False
     
     # Name
-    name = input("Project name: ").strip()
+    if name is None:
+        name = input("Project name: ").strip()
+        prompted = True
     if not name:
         print(COLORS.warning("Cancelled"))
         return
@@ -374,21 +452,29 @@ def cmd_create() -> None:
         return
     
     # Path
-    path_str = input("Path (Enter = current folder): ").strip()
-    path = Path(path_str).resolve() if path_str else Path.cwd()
+    if path is None:
+        path_str = input("Path (Enter = current folder): ").strip()
+        path = Path(path_str).resolve() if path_str else Path.cwd()
+        prompted = True
     
     # Template
-    template = select_template()
+    if template is None:
+        template = select_template()
+        prompted = True
     
     # Options
-    print("\nOptions:\n")
-    include_docker = input("  Add Docker? (Y/n): ").strip().lower() != 'n'
-    include_ci = input("  Add CI/CD? (Y/n): ").strip().lower() != 'n'
-    include_git = input("  Initialize Git? (Y/n): ").strip().lower() != 'n'
+    if None in (include_docker, include_ci, include_git):
+        print("\nOptions:\n")
+        prompted = True
+    if include_docker is None:
+        include_docker = _ask_yes("  Add Docker? (Y/n): ")
+    if include_ci is None:
+        include_ci = _ask_yes("  Add CI/CD? (Y/n): ")
+    if include_git is None:
+        include_git = _ask_yes("  Initialize Git? (Y/n): ")
     
     # Confirm
-    confirm = input("\nCreate project? (Y/n): ").strip().lower()
-    if confirm == 'n':
+    if prompted and not _ask_yes("\nCreate project? (Y/n): "):
         print(COLORS.warning("Cancelled"))
         return
     
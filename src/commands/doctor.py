@@ -9,6 +9,7 @@ import os
 import shutil
 import subprocess
 import tarfile
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -16,6 +17,7 @@ from pathlib import Path
 from typing import List, Optional
 
 from ..core.constants import COLORS, VERSION
+from ..core.file_utils import get_dir_bytes
 from ..utils.status_generator import update_status
 
 # Import architect module for architectural restructuring
@@ -203,14 +205,7 @@ class Doctor:
     
     def _get_dir_size(self, path: Path) -> int:
         """Get directory size in bytes."""
-        total = 0
-        try:
-            for file in path.rglob("*"):
-                if file.is_file():
-                    total += file.stat().st_size
-        except Exception:
-            pass
-        return total
+        return get_dir_bytes(path)
     
     def _format_size(self, size_bytes: int) -> str:
         """Format bytes to human readable string."""
@@ -1577,20 +1572,17 @@ def print_token_breakdown(report: DiagnosticReport) -> None:
     print("║  BREAKDOWN BY FILE TYPE:                                         ║")
     print("║                                                                  ║")
     
-    by_ext = {}
+    ext_counts: Counter[str] = Counter()
+    ext_tokens: Counter[str] = Counter()
     for ft in report.file_tokens:
         ext = ft.path.suffix or "(no ext)"
-        if ext not in by_ext:
-            by_ext[ext] = {"count": 0, "tokens": 0}
-        by_ext[ext]["count"] += 1
-        by_ext[ext]["tokens"] += ft.tokens
-    
-    # Sort by tokens
-    sorted_ext = sorted(by_ext.items(), key=lambda x: x[1]["tokens"], reverse=True)
+        ext_counts[ext] += 1
+        ext_tokens[ext] += ft.tokens
     
-    for ext, data in sorted_ext[:10]:
-        tokens_display = f"{data['tokens']/1000:.1f}K".rjust(8)
-        count_display = f"({data['count']} files)"
+    # Top 10 by tokens
+    for ext, tokens in ext_tokens.most_common(10):
+        tokens_display = f"{tokens/1000:.1f}K".rjust(8)
+        count_display = f"({ext_counts[ext]} files)"
         line = f"  {ext.ljust(10)} {tokens_display} {count_display}"[:65]
         print(f"║{line:<67}║")
     
@@ -5,65 +5,76 @@ Health command - check project health
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TextIO
 
-from ..core.constants import COLORS, VERSION
+from ..core.constants import COLORS, PLAIN_COLORS, VERSION
 
 
-def health_check(project_path: Path) -> bool:
+def health_check(project_path: Path, writer: TextIO | None = None, color: bool = True) -> bool:
     """
     Check project health
     
+    Args:
+        project_path: Path to project
+        writer: Where the report goes (default: sys.stdout)
+        color: Use ANSI colors (if the terminal takes them); False for plain text
+    
     Returns:
         True if all checks passed
     """
+    colors = COLORS if color else PLAIN_COLORS
+    
+    def emit(text: str) -> None:
+        print(text, file=writer)
+    
     project_name = project_path.name
     
-    print(f"""
-{COLORS.colorize('=' * 50, COLORS.CYAN)}
-{COLORS.colorize(f'Health Check: {project_name}', COLORS.CYAN)}
-{COLORS.colorize('=' * 50, COLORS.CYAN)}
+    emit(f"""
+{colors.SEP_CYAN_50}
+{colors.colorize(f'Health Check: {project_name}', colors.CYAN)}
+{colors.SEP_CYAN_50}
 """)
     
     errors = 0
     warnings = 0
     
     # 1. Venv
-    print(f"{COLORS.colorize('Virtual Environment', COLORS.BOLD)}")
+    emit(f"{colors.colorize('Virtual Environment', colors.BOLD)}")
     venv_path = project_path.parent / "_venvs" / f"{project_name}-venv"
     
     if venv_path.exists():
-        print(f"   {COLORS.success(f'Venv: {venv_path}')}")
+        emit(f"   {colors.success(f'Venv: {venv_path}')}")
     else:
-        print(f"   {COLORS.error(f'Venv not found: {venv_path}')}")
+        emit(f"   {colors.error(f'Venv not found: {venv_path}')}")
         errors += 1
     
     for bad in ["venv", ".venv", "env"]:
         if (project_path / bad).is_dir():
-            print(f"   {COLORS.error(f'FORBIDDEN: {bad}/ in project!')}")
+            emit(f"   {colors.error(f'FORBIDDEN: {bad}/ in project!')}")
             errors += 1
     
     # 2. Configuration
-    print(f"\n{COLORS.colorize('Configuration', COLORS.BOLD)}")
+    emit(f"\n{colors.colorize('Configuration', colors.BOLD)}")
     
     if (project_path / ".env").exists():
-        print(f"   {COLORS.success('.env')}")
+        emit(f"   {colors.success('.env')}")
     else:
-        print(f"   {COLORS.warning('.env missing')}")
+        emit(f"   {colors.warning('.env missing')}")
         warnings += 1
     
     if (project_path / "requirements.txt").exists():
-        print(f"   {COLORS.success('requirements.txt')}")
+        emit(f"   {colors.success('requirements.txt')}")
     else:
-        print(f"   {COLORS.warning('requirements.txt missing')}")
+        emit(f"   {colors.warning('requirements.txt missing')}")
         warnings += 1
     
     # 3. AI configs
-    print(f"\n{COLORS.colorize('AI Configuration', COLORS.BOLD)}")
+    emit(f"\n{colors.colorize('AI Configuration', colors.BOLD)}")
     
     if (project_path / "_AI_INCLUDE").exists():
-        print(f"   {COLORS.success('_AI_INCLUDE/')}")
+        emit(f"   {colors.success('_AI_INCLUDE/')}")
     else:
-        print(f"   {COLORS.error('_AI_INCLUDE/ missing')}")
+        emit(f"   {colors.error('_AI_INCLUDE/ missing')}")
         errors += 1
     
     ai_files = [
@@ -75,74 +86,74 @@ def health_check(project_path: Path) -> bool:
     
     for file, name in ai_files:
         if (project_path / file).exists():
-            print(f"   {COLORS.success(name)}")
+            emit(f"   {colors.success(name)}")
     
     # 4. Scripts
-    print(f"\n{COLORS.colorize('Scripts', COLORS.BOLD)}")
+    emit(f"\n{colors.colorize('Scripts', colors.BOLD)}")
     
     scripts = ["bootstrap.sh", "health_check.sh", "context.py"]
     for script in scripts:
         if (project_path / "scripts" / script).exists():
-            print(f"   {COLORS.success(script)}")
+            emit(f"   {colors.success(script)}")
         else:
-            print(f"   {COLORS.warning(f'{script} missing')}")
+            emit(f"   {colors.warning(f'{script} missing')}")
             warnings += 1
     
     # 5. Docker
-    print(f"\n{COLORS.colorize('Docker', COLORS.BOLD)}")
+    emit(f"\n{colors.colorize('Docker', colors.BOLD)}")
     
     if (project_path / "Dockerfile").exists():
-        print(f"   {COLORS.success('Dockerfile')}")
+        emit(f"   {colors.success('Dockerfile')}")
     else:
-        print(f"   {COLORS.info('Dockerfile missing')}")
+        emit(f"   {colors.info('Dockerfile missing')}")
     
     if (project_path / "docker-compose.yml").exists():
-        print(f"   {COLORS.success('docker-compose.yml')}")
+        emit(f"   {colors.success('docker-compose.yml')}")
     
     # 6. CI/CD
-    print(f"\n{COLORS.colorize('CI/CD', COLORS.BOLD)}")
+    emit(f"\n{colors.colorize('CI/CD', colors.BOLD)}")
     
     if (project_path / ".github" / "workflows" / "ci.yml").exists():
-        print(f"   {COLORS.success('GitHub Actions')}")
+        emit(f"   {colors.success('GitHub Actions')}")
     else:
-        print(f"   {COLORS.info('CI not configured')}")
+        emit(f"   {colors.info('CI not configured')}")
     
     # 7. Git
-    print(f"\n{COLORS.colorize('Git', COLORS.BOLD)}")
+    emit(f"\n{colors.colorize('Git', colors.BOLD)}")
     
     if (project_path / ".git").exists():
-        print(f"   {COLORS.success('Git repository')}")
+        emit(f"   {colors.success('Git repository')}")
     else:
-        print(f"   {COLORS.warning('Not a git repository')}")
+        emit(f"   {colors.warning('Not a git repository')}")
         warnings += 1
     
     # 8. Toolkit version
-    print(f"\n{COLORS.colorize('Toolkit', COLORS.BOLD)}")
+    emit(f"\n{colors.colorize('Toolkit', colors.BOLD)}")
     
     version_file = project_path / ".toolkit-version"
     if version_file.exists():
         version = version_file.read_text().strip()
         if version == VERSION:
-            print(f"   {COLORS.success(f'Version: {version}')}")
+            emit(f"   {colors.success(f'Version: {version}')}")
         else:
-            print(f"   {COLORS.warning(f'Version {version} -> available {VERSION}')}")
+            emit(f"   {colors.warning(f'Version {version} -> available {VERSION}')}")
             warnings += 1
     else:
-        print(f"   {COLORS.warning('Version not specified')}")
+        emit(f"   {colors.warning('Version not specified')}")
         warnings += 1
     
     # Summary
-    print(f"""
-{COLORS.colorize('=' * 50, COLORS.CYAN)}""")
+    emit(f"""
+{colors.SEP_CYAN_50}""")
     
     if errors == 0 and warnings == 0:
-        print(f"{COLORS.success('All checks passed!')}")
+        emit(f"{colors.success('All checks passed!')}")
         return True
     elif errors == 0:
-        print(f"{COLORS.warning(f'{warnings} warnings')}")
+        emit(f"{colors.warning(f'{warnings} warnings')}")
         return True
     else:
-        print(f"{COLORS.error(f'{errors} errors, {warnings} warnings')}")
+        emit(f"{colors.error(f'{errors} errors, {warnings} warnings')}")
         return False
 
 
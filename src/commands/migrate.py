@@ -5,7 +5,7 @@ Migrate command - add Toolkit to existing project
 from __future__ import annotations
 
 from pathlib import Path
-from datetime import datetime
+import datetime
 
 from ..core.constants import COLORS
 from ..core.config import get_default_ai_targets
@@ -36,13 +36,13 @@ def migrate_project(
         ai_targets = get_default_ai_targets()
     
     project_name = project_path.name
-    date = datetime.now().strftime("%Y-%m-%d")
+    date = datetime.date.today().isoformat()
     
     if not quiet:
         print(f"""
-{COLORS.colorize('=' * 50, COLORS.CYAN)}
+{COLORS.SEP_CYAN_50}
 {COLORS.colorize(f'Migrating: {project_name}', COLORS.CYAN)}
-{COLORS.colorize('=' * 50, COLORS.CYAN)}
+{COLORS.SEP_CYAN_50}
 """)
     
     # AI configs (if not exist)
@@ -69,34 +69,45 @@ def migrate_project(
     
     if not quiet:
         print(f"""
-{COLORS.colorize('=' * 50, COLORS.GREEN)}
+{COLORS.SEP_GREEN_50}
 {COLORS.success('Migration complete!')}
-{COLORS.colorize('=' * 50, COLORS.GREEN)}
+{COLORS.SEP_GREEN_50}
 """)
     
     return True
 
 
-def cmd_migrate() -> None:
-    """Interactive migrate command"""
+def cmd_migrate(path: Path | None = None, ai_targets: list[str] | None = None) -> None:
+    """
+    Interactive migrate command
+    
+    Args:
+        path: Project path; prompted for (and confirmed) if not given
+        ai_targets: AI list (default from config)
+    """
     print(COLORS.colorize("\nMIGRATE PROJECT\n", COLORS.GREEN))
     
-    path_str = input("Project path: ").strip()
-    if not path_str:
-        print(COLORS.warning("Cancelled"))
-        return
+    prompted = path is None
+    if path is None:
+        path_str = input("Project path: ").strip()
+        if not path_str:
+            print(COLORS.warning("Cancelled"))
+            return
+        path = Path(path_str)
     
-    path = Path(path_str).resolve()
+    path = path.resolve()
     if not path.exists():
         print(COLORS.error(f"Path does not exist: {path}"))
         return
     
-    ai_targets = get_default_ai_targets()
+    if ai_targets is None:
+        ai_targets = get_default_ai_targets()
     print(f"\n  AI: {', '.join(ai_targets)}")
     
-    confirm = input(f"\nAdd Toolkit to {path.name}? (Y/n): ").strip().lower()
-    if confirm == 'n':
-        print(COLORS.warning("Cancelled"))
-        return
+    if prompted:
+        confirm = input(f"\nAdd Toolkit to {path.name}? (Y/n): ").strip().lower()
+        if confirm == 'n':
+            print(COLORS.warning("Cancelled"))
+            return
     
     migrate_project(path, ai_targets)
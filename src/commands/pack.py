@@ -11,7 +11,9 @@ from datetime import datetime
 from xml.sax.saxutils import escape
 
 from ..core.constants import COLORS, VERSION
-from ..utils.metrics import parse_cursorignore, should_ignore, EXCLUDE_DIRS, BINARY_EXTENSIONS
+from ..utils.metrics import (
+    compile_ignore, match_ignore, parse_cursorignore, rel_prefix_len, EXCLUDE_DIRS, BINARY_EXTENSIONS,
+)
 
 
 # Maximum file size to include (1MB)
@@ -23,7 +25,8 @@ MAX_PACK_SIZE = 10 * 1024 * 1024
 
 def pack_context(
     target_path: Path,
-    output_file: str = "context_dump.xml"
+    output_file: str = "context_dump.xml",
+    max_file_size: int = MAX_FILE_SIZE,
 ) -> tuple[bool, int, int]:
     """
     Pack project context into a single XML file
@@ -31,6 +34,7 @@ def pack_context(
     Args:
         target_path: Path to project root
         output_file: Output filename
+        max_file_size: Skip files larger than this many bytes
         
     Returns:
         Tuple of (success, files_packed, total_size)
@@ -42,32 +46,29 @@ def pack_context(
         return False, 0, 0
     
     # Parse ignore patterns
-    ignore_patterns = parse_cursorignore(target_path)
+    ignore_patterns = compile_ignore(parse_cursorignore(target_path))
+    prefix_len = rel_prefix_len(target_path)
     
     # Collect files
-    files_to_pack: list[tuple[Path, str]] = []  # (path, relative_path)
+    files_to_pack: list[tuple[str, str]] = []  # (path, relative_path)
     total_size = 0
     
     for dirpath, dirnames, filenames in os.walk(target_path):
-        current = Path(dirpath)
+        # Child paths are prefix + name: one join per directory, not per file
+        prefix = os.path.join(dirpath, "")
         
-        # Filter directories
+        # Prune directories: name checks first, then one regex search
         dirnames[:] = [
             d for d in dirnames 
             if d not in EXCLUDE_DIRS
             and not d.startswith(".")
-            and not (ignore_patterns and should_ignore(current / d, target_path, ignore_patterns))
+            and not (ignore_patterns and match_ignore(ignore_patterns, prefix + d, prefix_len))
         ]
         
         for filename in sorted(filenames):
-            file_path = current / filename
-            
-            # Skip ignored files
-            if ignore_patterns and should_ignore(file_path, target_path, ignore_patterns):
-                continue
             
             # Skip binary files
-            if file_path.suffix.lower() in BINARY_EXTENSIONS:
+            if os.path.splitext(filename)[1].lower() in BINARY_EXTENSIONS:
                 continue
             
             # Skip hidden files
@@ -78,16 +79,20 @@ def pack_context(
             if filename == output_file:
                 continue
             
+            # Skip ignored files (after the plain string checks)
+            file_path = prefix + filename
+            if ignore_patterns and match_ignore(ignore_patterns, file_path, prefix_len):
+                continue
+            
             # Check file size
             try:
-                size = file_path.stat().st_size
-                if size > MAX_FILE_SIZE:
+                size = os.stat(file_path).st_size
+                if size > max_file_size:
                     continue
                 if total_size + size > MAX_PACK_SIZE:
                     break
                 
-                rel_path = str(file_path.relative_to(target_path))
-                files_to_pack.append((file_path, rel_path))
+                files_to_pack.append((file_path, file_path[prefix_len:]))
                 total_size += size
                 
             except OSError:
@@ -114,7 +119,8 @@ def pack_context(
     
     for file_path, rel_path in files_to_pack:
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
+            with open(file_path, encoding="utf-8", errors="ignore") as f:
+                content = f.read()
             escaped_content = escape(content)
             
             xml_lines.extend([
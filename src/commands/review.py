@@ -9,6 +9,7 @@ import re
 import subprocess
 import shutil
 import math
+from collections import Counter
 from pathlib import Path
 from dataclasses import dataclass
 
@@ -75,9 +76,7 @@ def calculate_entropy(text: str) -> float:
     if not text:
         return 0.0
     
-    freq = {}
-    for char in text:
-        freq[char] = freq.get(char, 0) + 1
+    freq = Counter(text)
     
     entropy = 0.0
     for count in freq.values():
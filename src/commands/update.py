@@ -23,9 +23,9 @@ def update_project(project_path: Path) -> bool:
         return True
     
     print(f"""
-{COLORS.colorize('=' * 50, COLORS.CYAN)}
+{COLORS.SEP_CYAN_50}
 {COLORS.colorize(f'Updating: {project_name}', COLORS.CYAN)}
-{COLORS.colorize('=' * 50, COLORS.CYAN)}
+{COLORS.SEP_CYAN_50}
    {old_version} -> {VERSION}
 """)
     
@@ -59,24 +59,32 @@ def update_project(project_path: Path) -> bool:
     print(f"  {COLORS.success(f'.toolkit-version -> {VERSION}')}")
     
     print(f"""
-{COLORS.colorize('=' * 50, COLORS.GREEN)}
+{COLORS.SEP_GREEN_50}
 {COLORS.success('Update complete!')}
-{COLORS.colorize('=' * 50, COLORS.GREEN)}
+{COLORS.SEP_GREEN_50}
 """)
     
     return True
 
 
-def cmd_update() -> None:
-    """Interactive update command"""
+def cmd_update(path: Path | None = None) -> None:
+    """
+    Interactive update command
+    
+    Args:
+        path: Project path; prompted for (and confirmed) if not given
+    """
     print(COLORS.colorize("\nUPDATE PROJECT\n", COLORS.GREEN))
     
-    path_str = input("Project path: ").strip()
-    if not path_str:
-        print(COLORS.warning("Cancelled"))
-        return
+    prompted = path is None
+    if path is None:
+        path_str = input("Project path: ").strip()
+        if not path_str:
+            print(COLORS.warning("Cancelled"))
+            return
+        path = Path(path_str)
     
-    path = Path(path_str).resolve()
+    path = path.resolve()
     if not path.exists():
         print(COLORS.error(f"Path does not exist: {path}"))
         return
@@ -84,6 +92,7 @@ def cmd_update() -> None:
     version_file = path / ".toolkit-version"
     if not version_file.exists():
         print(COLORS.warning("Not a Toolkit project (no .toolkit-version)"))
+        # Migrating is a different operation: always ask
         confirm = input("Continue with migration? (y/N): ").strip().lower()
         if confirm != 'y':
             return
@@ -97,12 +106,12 @@ def cmd_update() -> None:
         print(COLORS.info(f"Already on latest version: {VERSION}"))
         return
     
-    print(f"  Current: {old_version}")
-    print(f"  New: {VERSION}")
+    print(f"  Current: {old_version}\n  New: {VERSION}")
     
-    confirm = input("\nUpdate? (Y/n): ").strip().lower()
-    if confirm == 'n':
-        print(COLORS.warning("Cancelled"))
-        return
+    if prompted:
+        confirm = input("\nUpdate? (Y/n): ").strip().lower()
+        if confirm == 'n':
+            print(COLORS.warning("Cancelled"))
+            return
     
     update_project(path)
@@ -12,18 +12,15 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
 
-# Try to import rich for beautiful TUI
-try:
+# rich for beautiful TUI; only imported once the rich wizard runs, so other
+# commands (and --help) don't pay for it
+HAS_RICH = find_spec("rich") is not None
+
+if TYPE_CHECKING:
     from rich.console import Console
-    from rich.panel import Panel
-    from rich.prompt import Prompt, Confirm
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich import box
-    HAS_RICH = True
-except ImportError:
-    HAS_RICH = False
 
 from ..core.constants import COLORS, VERSION, TEMPLATES
 from ..core.config import set_default_ide, get_default_ai_targets
@@ -331,6 +328,11 @@ def generate_doctor_report(
 
 def flow_create_rich(console: Console) -> bool:
     """Create new project flow with rich UI"""
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
+    from rich.table import Table
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich import box
     
     console.print(Panel(
         "[bold cyan]🐣 Create New Project[/bold cyan]\n"
@@ -427,6 +429,11 @@ def flow_create_rich(console: Console) -> bool:
 
 def flow_optimize_rich(console: Console) -> bool:
     """The Ultimate Doctor flow with rich UI"""
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
+    from rich.table import Table
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich import box
     from ..utils.metrics import scan_project, ScanResult
     from ..utils.cleaner import archive_artifacts
     
@@ -718,6 +725,11 @@ def flow_optimize_plain() -> bool:
 
 def run_wizard_rich() -> bool:
     """Run wizard with rich UI"""
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    from rich import box
+    
     console = Console()
     
     console.print()
@@ -2,43 +2,80 @@
 Project constants
 """
 
+import functools
+import os
+import sys
+
 VERSION = "3.0.0"
 
 
+def _use_color() -> bool:
+    """Color only when stdout is a terminal and NO_COLOR is not set"""
+    if os.environ.get("NO_COLOR") is not None:
+        return False
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
 class COLORS:
-    """ANSI colors for terminal"""
-    BLUE = "\033[94m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    RED = "\033[91m"
-    CYAN = "\033[96m"
-    MAGENTA = "\033[95m"
-    BOLD = "\033[1m"
-    DIM = "\033[2m"
-    END = "\033[0m"
+    """ANSI colors for terminal (plain text when piped or redirected)"""
+    ENABLED: bool = _use_color()
+    
+    # Blank when disabled, so code concatenating the codes gets plain text too
+    BLUE: str = "\033[94m" if ENABLED else ""
+    GREEN: str = "\033[92m" if ENABLED else ""
+    YELLOW: str = "\033[93m" if ENABLED else ""
+    RED: str = "\033[91m" if ENABLED else ""
+    CYAN: str = "\033[96m" if ENABLED else ""
+    MAGENTA: str = "\033[95m" if ENABLED else ""
+    BOLD: str = "\033[1m" if ENABLED else ""
+    DIM: str = "\033[2m" if ENABLED else ""
+    END: str = "\033[0m" if ENABLED else ""
+    
+    # Banner separators, colored once
+    SEP_CYAN_50: str = f"{CYAN}{'=' * 50}{END}"
+    SEP_GREEN_50: str = f"{GREEN}{'=' * 50}{END}"
+    SEP_CYAN_60: str = f"{CYAN}{'=' * 60}{END}"
+    SEP_GREEN_60: str = f"{GREEN}{'=' * 60}{END}"
     
     @classmethod
     def colorize(cls, text: str, color: str) -> str:
         """Colorize text"""
+        if not cls.ENABLED:
+            return text
         return f"{color}{text}{cls.END}"
     
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def success(cls, text: str) -> str:
         return cls.colorize(f"[OK] {text}", cls.GREEN)
     
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def error(cls, text: str) -> str:
         return cls.colorize(f"[ERROR] {text}", cls.RED)
     
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def warning(cls, text: str) -> str:
         return cls.colorize(f"[WARN] {text}", cls.YELLOW)
     
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def info(cls, text: str) -> str:
         return cls.colorize(f"[INFO] {text}", cls.CYAN)
 
 
+class PLAIN_COLORS(COLORS):
+    """COLORS with every code blank, for output that never reaches a terminal"""
+    ENABLED: bool = False
+    
+    BLUE = GREEN = YELLOW = RED = CYAN = MAGENTA = BOLD = DIM = END = ""
+    
+    SEP_CYAN_50 = SEP_GREEN_50 = "=" * 50
+    SEP_CYAN_60 = SEP_GREEN_60 = "=" * 60
+
+
 # IDE configurations
 IDE_CONFIGS = {
     "cursor": {
@@ -113,6 +150,15 @@ TEMPLATES = {
     },
 }
 
+# Each template's modules as a set, for membership tests (kept out of
+# TEMPLATES itself, which is served as JSON)
+TEMPLATE_MODULES = {
+    name: frozenset(tmpl.get("modules", ())) for name, tmpl in TEMPLATES.items()
+}
+
+# Template ids in menu order; choice N is TEMPLATE_IDS[N - 1]
+TEMPLATE_IDS = tuple(TEMPLATES)
+
 # Cleanup levels
 CLEANUP_LEVELS = {
     "safe": {
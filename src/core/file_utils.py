@@ -7,44 +7,267 @@ from __future__ import annotations
 import os
 import stat
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable
 
 from .constants import COLORS
 
 
+def _read_umask() -> int:
+    """Read the process umask (os.umask can only be read by setting it)"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _read_umask()
+
+# Bits make_executable() adds to a file's mode
+_EXEC_BITS = stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH
+
+# With no execute bits in the umask, creating with 0o777 yields what
+# make_executable() would give a new file, and it needs no fchmod
+_CREATE_EXEC = (_UMASK & 0o111) == 0
+
+# Newline as a text-mode write (path.write_text) puts it on this platform
+_NEWLINE = os.linesep.encode("ascii")
+
+# O_BINARY: newlines are translated once, in _encode(), not again by the CRT
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+
+# dir_fd-relative open is POSIX-only (not available on Windows)
+_HAS_DIR_FD = os.open in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+
 def create_file(
-    path: Path, 
-    content: str, 
+    path: str | Path, 
+    content: str | bytes, 
     executable: bool = False,
-    quiet: bool = False
+    quiet: bool = False,
+    skip_parent_mkdir: bool = False,
 ) -> None:
     """
     Create file with content
     
     Args:
-        path: File path
-        content: Content
+        path: File path (a str is used as is, without a Path round-trip)
+        content: Content (bytes are written as is, already encoded)
         executable: Make executable
         quiet: Don't print message
+        skip_parent_mkdir: Parent is known to exist (e.g. from make_dirs)
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    # Add newline at end if not present
-    if content and not content.endswith("\n"):
-        content = content + "\n"
-    path.write_text(content, encoding="utf-8")
+    if not skip_parent_mkdir:
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+    _write(path, _encode(content), executable)
     
-    if executable:
+    if executable and not hasattr(os, "fchmod"):
         make_executable(path)
     
     if not quiet:
-        rel_path = path.name if len(str(path)) > 50 else path
-        print(f"  {COLORS.success(str(rel_path))}")
+        print(_created_line(path))
+
+
+def _encode(content: str | bytes) -> bytes:
+    """
+    UTF-8 file content, with a newline at end if not present
+    
+    Newlines are translated as text mode would (CRLF on Windows).
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    if content and not content.endswith(b"\n"):
+        content = content + b"\n"
+    if _NEWLINE != b"\n":
+        content = content.replace(b"\n", _NEWLINE)
+    return content
+
+
+def _write(
+    path: Path | str,
+    data: bytes,
+    executable: bool,
+    dir_fd: int | None = None,
+) -> None:
+    """Write data with one open/write/close; with dir_fd, path is relative to it"""
+    chmod = executable and hasattr(os, "fchmod")
+    if chmod and _CREATE_EXEC:
+        # New file: the open mode is the final mode. Existing file: O_TRUNC
+        # keeps its old mode, so fall through to fchmod
+        try:
+            fd = os.open(path, _WRITE_FLAGS | os.O_EXCL, 0o777, dir_fd=dir_fd)
+            chmod = False
+        except FileExistsError:
+            fd = os.open(path, _WRITE_FLAGS, 0o666, dir_fd=dir_fd)
+    else:
+        fd = os.open(path, _WRITE_FLAGS, 0o666, dir_fd=dir_fd)
+    try:
+        if chmod:
+            # Add the execute bits on the open fd instead of a later stat + chmod
+            os.fchmod(fd, stat.S_IMODE(os.fstat(fd).st_mode) | _EXEC_BITS)
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _created_line(path: str | Path) -> str:
+    """The create_file success line"""
+    path = os.fspath(path)
+    rel_path = os.path.basename(path) if len(path) > 50 else path
+    return f"  {COLORS.success(rel_path)}"
+
+
+def create_files_batch(
+    files: list[tuple[str | Path, str | bytes, bool]],
+    quiet: bool = False,
+    skip_parent_mkdir: bool = False,
+    root: Path | None = None,
+) -> None:
+    """
+    Create many files, writing them on a small thread pool
+    
+    Messages are printed afterwards, in the order given.
+    
+    Args:
+        files: (path, content, executable) triples
+        quiet: Don't print messages
+        skip_parent_mkdir: Every parent is known to exist (e.g. from make_dirs)
+        root: Common ancestor of all paths; when parents exist, it is opened
+            once and every file is opened relative to it (openat)
+    """
+    dir_fd: int | None = None
+    if root is not None and skip_parent_mkdir and _HAS_DIR_FD:
+        dir_fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+    
+    def write(spec: tuple[str | Path, str | bytes, bool]) -> None:
+        path, content, executable = spec
+        if dir_fd is None:
+            create_file(path, content, executable, quiet=True, skip_parent_mkdir=skip_parent_mkdir)
+            return
+        _write(os.path.relpath(path, root), _encode(content), executable, dir_fd)
+    
+    try:
+        if len(files) < 2:
+            for spec in files:
+                write(spec)
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+                list(pool.map(write, files))
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    
+    if not quiet:
+        print("\n".join(_created_line(path) for path, _, _ in files))
+
+
+class WriteQueue:
+    """
+    Files to write later in one create_files_batch() call
+    
+    Progress lines given to echo() are kept in order with the files'
+    success lines and printed together on flush().
+    """
+    
+    def __init__(self, root: Path | None = None, skip_parent_mkdir: bool = False) -> None:
+        """
+        Args:
+            root: Common ancestor of all paths (see create_files_batch)
+            skip_parent_mkdir: Every parent is known to exist (e.g. from make_dirs)
+        """
+        self.root = root
+        self.skip_parent_mkdir = skip_parent_mkdir
+        self.files: list[tuple[str | Path, str | bytes, bool]] = []
+        self._log: list[str | int] = []  # progress lines / indexes into files
+    
+    def add(
+        self,
+        path: str | Path,
+        content: str | bytes,
+        executable: bool = False,
+        quiet: bool = False,
+    ) -> None:
+        """Queue a file (quiet: print no success line for it)"""
+        if not quiet:
+            self._log.append(len(self.files))
+        self.files.append((path, content, executable))
+    
+    def echo(self, line: str) -> None:
+        """Queue a progress line"""
+        self._log.append(line)
+    
+    def flush(self) -> None:
+        """Write every queued file, then print the progress"""
+        create_files_batch(
+            self.files,
+            quiet=True,
+            skip_parent_mkdir=self.skip_parent_mkdir,
+            root=self.root,
+        )
+        if self._log:
+            print("\n".join(
+                item if isinstance(item, str) else _created_line(self.files[item][0])
+                for item in self._log
+            ))
+        self.files = []
+        self._log = []
+
+
+def emit_file(
+    path: str | Path,
+    content: str | bytes,
+    queue: WriteQueue | None = None,
+    executable: bool = False,
+    quiet: bool = False,
+) -> None:
+    """create_file() now, or add the file to queue"""
+    if queue is None:
+        create_file(path, content, executable, quiet=quiet)
+    else:
+        queue.add(path, content, executable, quiet=quiet)
+
 
+def emit_line(line: str, queue: WriteQueue | None = None) -> None:
+    """Print a progress line now, or add it to queue"""
+    if queue is None:
+        print(line)
+    else:
+        queue.echo(line)
 
-def make_executable(path: Path) -> None:
+
+def make_dirs(root: Path, dir_names: Iterable[str]) -> None:
+    """
+    Create directories under root, each exactly once
+    
+    Every parent of every entry is included and the set is created
+    shallowest first, so a plain os.mkdir never has to walk parents.
+    
+    Args:
+        root: Existing base directory
+        dir_names: Relative directory paths ("bot/handlers", ...)
+    """
+    wanted: set[tuple[str, ...]] = set()
+    for name in dir_names:
+        parts = Path(name).parts
+        for i in range(1, len(parts) + 1):
+            wanted.add(parts[:i])
+    
+    for parts in sorted(wanted, key=len):
+        try:
+            os.mkdir(root.joinpath(*parts))
+        except FileExistsError:
+            pass
+
+
+def make_executable(path: str | Path) -> None:
     """Make file executable"""
     st = os.stat(path)
-    os.chmod(path, st.st_mode | stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH)
+    os.chmod(path, st.st_mode | _EXEC_BITS)
 
 
 def copy_template(
@@ -77,14 +300,33 @@ def copy_template(
 
 def get_dir_size(path: Path) -> float:
     """Get directory size in MB"""
+    return get_dir_bytes(path) / (1024 * 1024)
+
+
+def get_dir_bytes(path: Path) -> int:
+    """
+    Get directory size in bytes
+    
+    Uses os.scandir so each entry's stat comes from the DirEntry cache
+    where the OS provides it; symlinks are counted, not followed.
+    """
     total = 0
-    try:
-        for p in path.rglob("*"):
-            if p.is_file():
-                total += p.stat().st_size
-    except (PermissionError, OSError):
-        pass
-    return total / (1024 * 1024)
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+    return total
 
 
 def remove_dir(path: Path) -> bool:
@@ -100,7 +342,9 @@ def remove_dir(path: Path) -> bool:
 def copy_dir(src: Path, dst: Path) -> bool:
     """Copy directory"""
     try:
-        shutil.copytree(src, dst)
+        # shutil.copy keeps the mode (exec bits) but skips copy2's
+        # timestamp/xattr copying; the data goes through the kernel fast path
+        shutil.copytree(src, dst, copy_function=shutil.copy)
         return True
     except Exception:
         return False
@@ -4,6 +4,8 @@ Template loader from files
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +15,9 @@ from .file_utils import create_file
 # Path to templates folder
 TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates"
 
+# Pattern for {{variable}} or {{variable|default}}
+VAR_PATTERN = re.compile(r'\{\{(\w+)(?:\|([^}]*))?\}\}')
+
 
 def load_template(template_path: str) -> str | None:
     """
@@ -32,6 +37,23 @@ def load_template(template_path: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=128)
+def _compile_template(content: str) -> tuple[tuple[str, str | None, str | None, str], ...]:
+    """
+    Split template into (literal, variable, default, placeholder) chunks
+    
+    Parsing happens once per distinct template; rendering then only joins.
+    The last chunk carries the trailing literal and variable None.
+    """
+    chunks = []
+    pos = 0
+    for match in VAR_PATTERN.finditer(content):
+        chunks.append((content[pos:match.start()], match.group(1), match.group(2), match.group(0)))
+        pos = match.end()
+    chunks.append((content[pos:], None, None, ""))
+    return tuple(chunks)
+
+
 def render_template(content: str, context: dict[str, Any]) -> str:
     """
     Render template with variable substitution
@@ -47,23 +69,19 @@ def render_template(content: str, context: dict[str, Any]) -> str:
     Returns:
         Rendered template
     """
-    import re
-    
-    # Pattern for {{variable}} or {{variable|default}}
-    pattern = r'\{\{(\w+)(?:\|([^}]*))?\}\}'
-    
-    def replacer(match: re.Match) -> str:
-        var_name = match.group(1)
-        default = match.group(2)
-        
+    parts = []
+    for literal, var_name, default, placeholder in _compile_template(content):
+        parts.append(literal)
+        if var_name is None:
+            continue
         if var_name in context:
-            return str(context[var_name])
+            parts.append(str(context[var_name]))
         elif default is not None:
-            return default
+            parts.append(default)
         else:
-            return match.group(0)  # Leave as is
+            parts.append(placeholder)  # Leave as is
     
-    return re.sub(pattern, replacer, content)
+    return "".join(parts)
 
 
 def copy_template_file(
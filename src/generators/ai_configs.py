@@ -5,9 +5,9 @@ AI config generator (.cursorrules, copilot-instructions.md, CLAUDE.md)
 from __future__ import annotations
 
 from pathlib import Path
-from datetime import datetime
+import datetime
 
-from ..core.file_utils import create_file
+from ..core.file_utils import WriteQueue, emit_file, emit_line
 from ..core.constants import COLORS
 
 
@@ -47,13 +47,17 @@ python scripts/context.py all   # Show all
 """
 
 
-def generate_cursor_rules(project_dir: Path, project_name: str, date: str) -> None:
+def generate_cursor_rules(
+    project_dir: Path, project_name: str, date: str, queue: WriteQueue | None = None
+) -> None:
     """Generate .cursorrules"""
     content = get_common_rules(project_name, date)
-    create_file(project_dir / ".cursorrules", content)
+    emit_file(project_dir / ".cursorrules", content, queue)
 
 
-def generate_cursor_ignore(project_dir: Path, project_name: str, date: str) -> None:
+def generate_cursor_ignore(
+    project_dir: Path, project_name: str, date: str, queue: WriteQueue | None = None
+) -> None:
     """Generate .cursorignore"""
     content = f"""# Cursor Ignore - {project_name}
 # Generated: {date}
@@ -95,10 +99,12 @@ build/
 .idea/
 *.swp
 """
-    create_file(project_dir / ".cursorignore", content)
+    emit_file(project_dir / ".cursorignore", content, queue)
 
 
-def generate_copilot_instructions(project_dir: Path, project_name: str, date: str) -> None:
+def generate_copilot_instructions(
+    project_dir: Path, project_name: str, date: str, queue: WriteQueue | None = None
+) -> None:
     """Generate .github/copilot-instructions.md"""
     content = f"""# Copilot Instructions - {project_name}
 
@@ -112,10 +118,12 @@ def generate_copilot_instructions(project_dir: Path, project_name: str, date: st
 - Use pydantic for data validation
 """
     (project_dir / ".github").mkdir(exist_ok=True)
-    create_file(project_dir / ".github" / "copilot-instructions.md", content)
+    emit_file(project_dir / ".github" / "copilot-instructions.md", content, queue)
 
 
-def generate_claude_md(project_dir: Path, project_name: str, date: str) -> None:
+def generate_claude_md(
+    project_dir: Path, project_name: str, date: str, queue: WriteQueue | None = None
+) -> None:
     """Generate CLAUDE.md"""
     content = f"""# Claude Instructions - {project_name}
 
@@ -128,16 +136,20 @@ def generate_claude_md(project_dir: Path, project_name: str, date: str) -> None:
 - Propose changes via str_replace
 - Do not read large files fully
 """
-    create_file(project_dir / "CLAUDE.md", content)
+    emit_file(project_dir / "CLAUDE.md", content, queue)
 
 
-def generate_windsurf_rules(project_dir: Path, project_name: str, date: str) -> None:
+def generate_windsurf_rules(
+    project_dir: Path, project_name: str, date: str, queue: WriteQueue | None = None
+) -> None:
     """Generate .windsurfrules"""
     content = get_common_rules(project_name, date)
-    create_file(project_dir / ".windsurfrules", content)
+    emit_file(project_dir / ".windsurfrules", content, queue)
 
 
-def generate_ai_include(project_dir: Path, project_name: str, date: str) -> None:
+def generate_ai_include(
+    project_dir: Path, project_name: str, date: str, queue: WriteQueue | None = None
+) -> None:
     """Generate _AI_INCLUDE/"""
     ai_dir = project_dir / "_AI_INCLUDE"
     ai_dir.mkdir(exist_ok=True)
@@ -165,7 +177,7 @@ Create via: ./scripts/bootstrap.sh
 2. Verify file doesn't exist
 3. Use correct directory
 """
-    create_file(ai_dir / "PROJECT_CONVENTIONS.md", conventions)
+    emit_file(ai_dir / "PROJECT_CONVENTIONS.md", conventions, queue)
     
     # WHERE_IS_WHAT.md
     where_is_what = f"""# Where Is What - {project_name}
@@ -192,14 +204,15 @@ database/*.db     -> sqlite3 ... ".schema"
 Location: ../_venvs/{project_name}-venv/
 Activate: source ../_venvs/{project_name}-venv/bin/activate
 """
-    create_file(ai_dir / "WHERE_IS_WHAT.md", where_is_what)
+    emit_file(ai_dir / "WHERE_IS_WHAT.md", where_is_what, queue)
 
 
 def generate_ai_configs(
     project_dir: Path,
     project_name: str,
     ai_targets: list[str],
-    date: str = None
+    date: str = None,
+    queue: WriteQueue | None = None,
 ) -> None:
     """
     Create all AI configs
@@ -209,29 +222,30 @@ def generate_ai_configs(
         project_name: Project name
         ai_targets: AI list (cursor, copilot, claude, windsurf)
         date: Date (default today)
+        queue: Queue the files (and progress) instead of writing them now
     """
     if date is None:
-        date = datetime.now().strftime("%Y-%m-%d")
+        date = datetime.date.today().isoformat()
     
-    print(f"\n{COLORS.colorize('AI configs...', COLORS.CYAN)}")
+    emit_line(f"\n{COLORS.colorize('AI configs...', COLORS.CYAN)}", queue)
     
     # Cursor
     if "cursor" in ai_targets:
-        generate_cursor_rules(project_dir, project_name, date)
-        generate_cursor_ignore(project_dir, project_name, date)
+        generate_cursor_rules(project_dir, project_name, date, queue)
+        generate_cursor_ignore(project_dir, project_name, date, queue)
     
     # Copilot
     if "copilot" in ai_targets:
-        generate_copilot_instructions(project_dir, project_name, date)
+        generate_copilot_instructions(project_dir, project_name, date, queue)
     
     # Claude
     if "claude" in ai_targets:
-        generate_claude_md(project_dir, project_name, date)
+        generate_claude_md(project_dir, project_name, date, queue)
     
     # Windsurf
     if "windsurf" in ai_targets:
-        generate_windsurf_rules(project_dir, project_name, date)
+        generate_windsurf_rules(project_dir, project_name, date, queue)
     
     # _AI_INCLUDE always
-    print(f"\n{COLORS.colorize('_AI_INCLUDE/...', COLORS.CYAN)}")
-    generate_ai_include(project_dir, project_name, date)
+    emit_line(f"\n{COLORS.colorize('_AI_INCLUDE/...', COLORS.CYAN)}", queue)
+    generate_ai_include(project_dir, project_name, date, queue)
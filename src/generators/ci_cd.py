@@ -6,11 +6,13 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from ..core.file_utils import create_file
+from ..core.file_utils import WriteQueue, emit_file, emit_line
 from ..core.constants import COLORS
 
 
-def generate_ci_workflow(project_dir: Path, project_name: str) -> None:
+def generate_ci_workflow(
+    project_dir: Path, project_name: str, queue: WriteQueue | None = None
+) -> None:
     """Generate .github/workflows/ci.yml"""
     content = f"""# CI - {project_name}
 # Runs on push and pull request
@@ -110,10 +112,12 @@ jobs:
 """
     workflows_dir = project_dir / ".github" / "workflows"
     workflows_dir.mkdir(parents=True, exist_ok=True)
-    create_file(workflows_dir / "ci.yml", content)
+    emit_file(workflows_dir / "ci.yml", content, queue)
 
 
-def generate_cd_workflow(project_dir: Path, project_name: str) -> None:
+def generate_cd_workflow(
+    project_dir: Path, project_name: str, queue: WriteQueue | None = None
+) -> None:
     """Generate .github/workflows/cd.yml (deploy)"""
     content = f"""# CD - {project_name}
 # Auto deploy on push to main
@@ -166,10 +170,10 @@ jobs:
 """
     workflows_dir = project_dir / ".github" / "workflows"
     workflows_dir.mkdir(parents=True, exist_ok=True)
-    create_file(workflows_dir / "cd.yml", content)
+    emit_file(workflows_dir / "cd.yml", content, queue)
 
 
-def generate_dependabot(project_dir: Path) -> None:
+def generate_dependabot(project_dir: Path, queue: WriteQueue | None = None) -> None:
     """Generate .github/dependabot.yml"""
     content = """# Dependabot - automatic dependency updates
 
@@ -209,10 +213,12 @@ updates:
       - "dependencies"
       - "docker"
 """
-    create_file(project_dir / ".github" / "dependabot.yml", content)
+    emit_file(project_dir / ".github" / "dependabot.yml", content, queue)
 
 
-def generate_pre_commit_config(project_dir: Path, project_name: str) -> None:
+def generate_pre_commit_config(
+    project_dir: Path, project_name: str, queue: WriteQueue | None = None
+) -> None:
     """Generate .pre-commit-config.yaml"""
     content = f"""# Pre-commit hooks - {project_name}
 # Install: pip install pre-commit && pre-commit install
@@ -258,20 +264,23 @@ repos:
   #     - id: mypy
   #       additional_dependencies: [types-all]
 """
-    create_file(project_dir / ".pre-commit-config.yaml", content)
+    emit_file(project_dir / ".pre-commit-config.yaml", content, queue)
 
 
-def generate_ci_files(project_dir: Path, project_name: str) -> None:
+def generate_ci_files(
+    project_dir: Path, project_name: str, queue: WriteQueue | None = None
+) -> None:
     """
     Create all CI/CD files
     
     Args:
         project_dir: Project path
         project_name: Project name
+        queue: Queue the files (and progress) instead of writing them now
     """
-    print(f"\n{COLORS.colorize('CI/CD...', COLORS.CYAN)}")
+    emit_line(f"\n{COLORS.colorize('CI/CD...', COLORS.CYAN)}", queue)
     
-    generate_ci_workflow(project_dir, project_name)
-    generate_cd_workflow(project_dir, project_name)
-    generate_dependabot(project_dir)
-    generate_pre_commit_config(project_dir, project_name)
+    generate_ci_workflow(project_dir, project_name, queue)
+    generate_cd_workflow(project_dir, project_name, queue)
+    generate_dependabot(project_dir, queue)
+    generate_pre_commit_config(project_dir, project_name, queue)
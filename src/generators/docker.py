@@ -4,45 +4,29 @@ Docker file generator
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from string import Template
 
-from ..core.file_utils import create_file
+from ..core.file_utils import WriteQueue, emit_file, emit_line
 from ..core.constants import COLORS
 
 
-def generate_dockerfile(project_dir: Path, project_name: str, template: str) -> None:
-    """Generate Dockerfile"""
-    
-    # Determine run command based on template
-    cmd_map = {
-        "bot": 'CMD ["python", "bot/main.py"]',
-        "webapp": 'CMD ["python", "-m", "http.server", "8000", "--directory", "webapp"]',
-        "fastapi": 'CMD ["uvicorn", "api.main:app", "--host", "0.0.0.0", "--port", "8000"]',
-        "parser": 'CMD ["python", "parser/main.py"]',
-        "full": 'CMD ["python", "bot/main.py"]',
-    }
-    
-    cmd = cmd_map.get(template, 'CMD ["python", "main.py"]')
-    
-    # Extra packages for different templates
-    extra_packages = ""
-    if template in ["parser", "full"]:
-        extra_packages = """
-# Playwright (if needed)
-# RUN pip install playwright && playwright install chromium --with-deps
-"""
-    
-    content = f"""# Dockerfile - {project_name}
-# Build: docker build -t {project_name} .
-# Run: docker run -d --env-file .env {project_name}
+# File bodies, built once at import
+_DOCKERFILE_HEADER_TPL = Template("""# Dockerfile - $project_name
+# Build: docker build -t $project_name .
+# Run: docker run -d --env-file .env $project_name
 
 FROM python:3.12-slim
 
 # Metadata
 LABEL maintainer="your@email.com"
 LABEL version="1.0.0"
-LABEL description="{project_name}"
+LABEL description="$project_name"
+""")
 
+# Static Dockerfile parts, encoded once; only the header is formatted per call
+_DOCKERFILE_BODY = b"""
 # Environment variables
 ENV PYTHONDONTWRITEBYTECODE=1
 ENV PYTHONUNBUFFERED=1
@@ -56,7 +40,9 @@ WORKDIR /app
 # RUN apt-get update && apt-get install -y --no-install-recommends \\
 #     gcc \\
 #     && rm -rf /var/lib/apt/lists/*
-{extra_packages}
+"""
+
+_DOCKERFILE_TAIL = b"""
 # Copy requirements and install dependencies
 COPY requirements.txt .
 RUN pip install --no-cache-dir -r requirements.txt
@@ -72,19 +58,9 @@ USER appuser
 # EXPOSE 8000
 
 # Run command
-{cmd}
 """
-    create_file(project_dir / "Dockerfile", content)
 
-
-def generate_docker_compose(project_dir: Path, project_name: str, template: str) -> None:
-    """Generate docker-compose.yml"""
-    
-    # Extra services
-    extra_services = ""
-    
-    if template in ["bot", "full", "fastapi"]:
-        extra_services = f"""
+_COMPOSE_SERVICES_TPL = Template("""
   # Redis (uncomment if needed)
   # redis:
   #   image: redis:7-alpine
@@ -97,28 +73,44 @@ def generate_docker_compose(project_dir: Path, project_name: str, template: str)
   #   image: postgres:16-alpine
   #   restart: unless-stopped
   #   environment:
-  #     POSTGRES_USER: ${{POSTGRES_USER:-{project_name}}}
-  #     POSTGRES_PASSWORD: ${{POSTGRES_PASSWORD:-secret}}
-  #     POSTGRES_DB: ${{POSTGRES_DB:-{project_name}}}
+  #     POSTGRES_USER: $${POSTGRES_USER:-$project_name}
+  #     POSTGRES_PASSWORD: $${POSTGRES_PASSWORD:-secret}
+  #     POSTGRES_DB: $${POSTGRES_DB:-$project_name}
   #   volumes:
   #     - postgres_data:/var/lib/postgresql/data
+""")
+
+# Per-template snippets; templates not listed get the default / nothing
+_RUN_CMD = {
+    "bot": b'CMD ["python", "bot/main.py"]\n',
+    "webapp": b'CMD ["python", "-m", "http.server", "8000", "--directory", "webapp"]\n',
+    "fastapi": b'CMD ["uvicorn", "api.main:app", "--host", "0.0.0.0", "--port", "8000"]\n',
+    "parser": b'CMD ["python", "parser/main.py"]\n',
+    "full": b'CMD ["python", "bot/main.py"]\n',
+}
+_DEFAULT_RUN_CMD = b'CMD ["python", "main.py"]\n'
+
+_PLAYWRIGHT = b"""
+# Playwright (if needed)
+# RUN pip install playwright && playwright install chromium --with-deps
 """
+_EXTRA_PACKAGES = {"parser": _PLAYWRIGHT, "full": _PLAYWRIGHT}
 
-    volumes_section = """
+_EXTRA_SERVICES = dict.fromkeys(("bot", "full", "fastapi"), _COMPOSE_SERVICES_TPL)
+
+_VOLUMES_SECTION = """
 # volumes:
 #   redis_data:
 #   postgres_data:
-""" if extra_services else ""
+"""
 
-    # Ports
-    ports = ""
-    if template in ["webapp", "fastapi"]:
-        ports = """
+_PORT_8000 = """
     ports:
       - "8000:8000"
 """
+_PORTS = {"webapp": _PORT_8000, "fastapi": _PORT_8000}
 
-    content = f"""# Docker Compose - {project_name}
+_COMPOSE_TPL = Template("""# Docker Compose - $project_name
 # Start: docker-compose up -d
 # Logs: docker-compose logs -f
 # Stop: docker-compose down
@@ -126,29 +118,24 @@ def generate_docker_compose(project_dir: Path, project_name: str, template: str)
 version: "3.8"
 
 services:
-  {project_name}:
+  $project_name:
     build: .
-    container_name: {project_name}
+    container_name: $project_name
     restart: unless-stopped
     env_file:
       - .env
-{ports}
+$ports
     volumes:
       - ./logs:/app/logs
       - ./data:/app/data
     # depends_on:
     #   - redis
     #   - postgres
-{extra_services}
-{volumes_section}
-"""
-    create_file(project_dir / "docker-compose.yml", content)
-
-
-def generate_dockerignore(project_dir: Path, project_name: str) -> None:
-    """Generate .dockerignore"""
-    content = f"""# Docker Ignore - {project_name}
+$extra_services
+$volumes_section
+""")
 
+_DOCKERIGNORE_BODY = b"""
 # Git
 .git
 .gitignore
@@ -202,10 +189,55 @@ _AI_INCLUDE/
 CLAUDE.md
 .windsurfrules
 """
-    create_file(project_dir / ".dockerignore", content)
 
 
-def generate_docker_files(project_dir: Path, project_name: str, template: str) -> None:
+def generate_dockerfile(
+    project_dir: Path, project_name: str, template: str, queue: WriteQueue | None = None
+) -> None:
+    """Generate Dockerfile"""
+    cmd = _RUN_CMD.get(template, _DEFAULT_RUN_CMD)
+    extra_packages = _EXTRA_PACKAGES.get(template, b"")
+    header = _DOCKERFILE_HEADER_TPL.substitute(project_name=project_name)
+    
+    content = b"".join((
+        header.encode("utf-8"), _DOCKERFILE_BODY, extra_packages, _DOCKERFILE_TAIL, cmd,
+    ))
+    emit_file(os.path.join(project_dir, "Dockerfile"), content, queue)
+
+
+def generate_docker_compose(
+    project_dir: Path, project_name: str, template: str, queue: WriteQueue | None = None
+) -> None:
+    """Generate docker-compose.yml"""
+    services = _EXTRA_SERVICES.get(template)
+    if services is not None:
+        extra_services = services.substitute(project_name=project_name)
+        volumes_section = _VOLUMES_SECTION
+    else:
+        extra_services = volumes_section = ""
+    ports = _PORTS.get(template, "")
+    
+    content = _COMPOSE_TPL.substitute(
+        project_name=project_name,
+        ports=ports,
+        extra_services=extra_services,
+        volumes_section=volumes_section,
+    )
+    emit_file(os.path.join(project_dir, "docker-compose.yml"), content, queue)
+
+
+def generate_dockerignore(
+    project_dir: Path, project_name: str, queue: WriteQueue | None = None
+) -> None:
+    """Generate .dockerignore"""
+    header = f"# Docker Ignore - {project_name}\n"
+    content = header.encode("utf-8") + _DOCKERIGNORE_BODY
+    emit_file(os.path.join(project_dir, ".dockerignore"), content, queue)
+
+
+def generate_docker_files(
+    project_dir: Path, project_name: str, template: str, queue: WriteQueue | None = None
+) -> None:
     """
     Create all Docker files
     
@@ -213,9 +245,10 @@ def generate_docker_files(project_dir: Path, project_name: str, template: str) -
         project_dir: Project path
         project_name: Project name
         template: Project template
+        queue: Queue the files (and progress) instead of writing them now
     """
-    print(f"\n{COLORS.colorize('Docker...', COLORS.CYAN)}")
+    emit_line(f"\n{COLORS.colorize('Docker...', COLORS.CYAN)}", queue)
     
-    generate_dockerfile(project_dir, project_name, template)
-    generate_docker_compose(project_dir, project_name, template)
-    generate_dockerignore(project_dir, project_name)
+    generate_dockerfile(project_dir, project_name, template, queue)
+    generate_docker_compose(project_dir, project_name, template, queue)
+    generate_dockerignore(project_dir, project_name, queue)
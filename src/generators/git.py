@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import subprocess
 from pathlib import Path
-from datetime import datetime
+import datetime
 
 from ..core.file_utils import create_file
 from ..core.constants import COLORS
@@ -14,7 +14,7 @@ from ..core.constants import COLORS
 
 def generate_gitignore(project_dir: Path, project_name: str) -> None:
     """Generate .gitignore"""
-    date = datetime.now().strftime("%Y-%m-%d")
+    date = datetime.date.today().isoformat()
     content = f"""# Git Ignore - {project_name}
 # Generated: {date}
 
@@ -212,6 +212,22 @@ def generate_gitattributes(project_dir: Path) -> None:
     create_file(project_dir / ".gitattributes", content)
 
 
+def _git(project_dir: Path, *args: str) -> subprocess.CompletedProcess:
+    """
+    Run one git command in project_dir, capturing its output
+    
+    close_fds=False lets CPython spawn with posix_spawn/vfork; our own
+    descriptors are non-inheritable anyway.
+    """
+    return subprocess.run(
+        ["git", *args],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+        close_fds=False,
+    )
+
+
 def init_git_repo(project_dir: Path, project_name: str, initial_commit: bool = True) -> bool:
     """
     Initialize Git repository
@@ -231,13 +247,12 @@ def init_git_repo(project_dir: Path, project_name: str, initial_commit: bool = T
     generate_gitattributes(project_dir)
     
     try:
-        # git init
-        result = subprocess.run(
-            ["git", "init"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True
-        )
+        # git init straight onto main (git >= 2.28); older git: init + rename
+        result = _git(project_dir, "init", "-b", "main")
+        if result.returncode != 0:
+            result = _git(project_dir, "init")
+            if result.returncode == 0:
+                _git(project_dir, "branch", "-M", "main")
         
         if result.returncode != 0:
             print(f"  {COLORS.warning('git init failed')}")
@@ -245,27 +260,11 @@ def init_git_repo(project_dir: Path, project_name: str, initial_commit: bool = T
         
         print(f"  {COLORS.success('git init')}")
         
-        # Set main as default branch
-        subprocess.run(
-            ["git", "branch", "-M", "main"],
-            cwd=project_dir,
-            capture_output=True
-        )
-        
         if initial_commit:
-            # git add .
-            subprocess.run(
-                ["git", "add", "."],
-                cwd=project_dir,
-                capture_output=True
-            )
-            
-            # git commit
-            result = subprocess.run(
-                ["git", "commit", "-m", f"Initial commit - {project_name}\n\nGenerated by AI Toolkit v3.0"],
-                cwd=project_dir,
-                capture_output=True,
-                text=True
+            _git(project_dir, "add", ".")
+            result = _git(
+                project_dir,
+                "commit", "-m", f"Initial commit - {project_name}\n\nGenerated by AI Toolkit v3.0",
             )
             
             if result.returncode == 0:
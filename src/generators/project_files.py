@@ -7,11 +7,13 @@ from __future__ import annotations
 from pathlib import Path
 from datetime import datetime
 
-from ..core.file_utils import create_file
-from ..core.constants import COLORS, TEMPLATES, VERSION
+from ..core.file_utils import WriteQueue, emit_file, emit_line
+from ..core.constants import COLORS, TEMPLATES, TEMPLATE_MODULES, VERSION
 
 
-def generate_requirements(project_dir: Path, project_name: str, template: str) -> None:
+def generate_requirements(
+    project_dir: Path, project_name: str, template: str, queue: WriteQueue | None = None
+) -> None:
     """Generate requirements.txt"""
     
     # Base dependencies
@@ -23,8 +25,7 @@ def generate_requirements(project_dir: Path, project_name: str, template: str) -
         "",
     ]
     
-    tmpl = TEMPLATES.get(template, {})
-    modules = tmpl.get("modules", [])
+    modules = TEMPLATE_MODULES.get(template, frozenset())
     
     # Telegram Bot
     if "bot" in modules or "handlers" in modules:
@@ -65,10 +66,10 @@ def generate_requirements(project_dir: Path, project_name: str, template: str) -
         ])
     
     content = f"# Requirements - {project_name}\n\n" + "\n".join(deps)
-    create_file(project_dir / "requirements.txt", content)
+    emit_file(project_dir / "requirements.txt", content, queue)
 
 
-def generate_requirements_dev(project_dir: Path) -> None:
+def generate_requirements_dev(project_dir: Path, queue: WriteQueue | None = None) -> None:
     """Generate requirements-dev.txt"""
     content = """# Development dependencies
 
@@ -89,10 +90,12 @@ pre-commit>=3.6
 # Debug
 ipython>=8.22
 """
-    create_file(project_dir / "requirements-dev.txt", content)
+    emit_file(project_dir / "requirements-dev.txt", content, queue)
 
 
-def generate_env_example(project_dir: Path, project_name: str, template: str) -> None:
+def generate_env_example(
+    project_dir: Path, project_name: str, template: str, queue: WriteQueue | None = None
+) -> None:
     """Generate .env.example"""
     
     lines = [
@@ -104,8 +107,7 @@ def generate_env_example(project_dir: Path, project_name: str, template: str) ->
         "",
     ]
     
-    tmpl = TEMPLATES.get(template, {})
-    modules = tmpl.get("modules", [])
+    modules = TEMPLATE_MODULES.get(template, frozenset())
     
     if "bot" in modules:
         lines.extend([
@@ -132,14 +134,15 @@ def generate_env_example(project_dir: Path, project_name: str, template: str) ->
         ])
     
     content = "\n".join(lines)
-    create_file(project_dir / ".env.example", content)
+    emit_file(project_dir / ".env.example", content, queue)
 
 
-def generate_config_py(project_dir: Path, project_name: str, template: str) -> None:
+def generate_config_py(
+    project_dir: Path, project_name: str, template: str, queue: WriteQueue | None = None
+) -> None:
     """Generate config.py"""
     
-    tmpl = TEMPLATES.get(template, {})
-    modules = tmpl.get("modules", [])
+    modules = TEMPLATE_MODULES.get(template, frozenset())
     
     # Config fields
     fields = ['    debug: bool = False']
@@ -181,10 +184,12 @@ class Settings(BaseSettings):
 # Global settings instance
 settings = Settings()
 '''
-    create_file(project_dir / "config.py", content)
+    emit_file(project_dir / "config.py", content, queue)
 
 
-def generate_readme(project_dir: Path, project_name: str, template: str) -> None:
+def generate_readme(
+    project_dir: Path, project_name: str, template: str, queue: WriteQueue | None = None
+) -> None:
     """Generate README.md"""
     
     tmpl = TEMPLATES.get(template, {})
@@ -286,15 +291,17 @@ MIT
 
 Generated by [AI Toolkit v{VERSION}](https://github.com/mickhael/ai-toolkit)
 """
-    create_file(project_dir / "README.md", content)
+    emit_file(project_dir / "README.md", content, queue)
 
 
-def generate_toolkit_version(project_dir: Path) -> None:
+def generate_toolkit_version(project_dir: Path, queue: WriteQueue | None = None) -> None:
     """Generate .toolkit-version"""
-    create_file(project_dir / ".toolkit-version", VERSION)
+    emit_file(project_dir / ".toolkit-version", VERSION, queue)
 
 
-def generate_pyproject_toml(project_dir: Path, project_name: str) -> None:
+def generate_pyproject_toml(
+    project_dir: Path, project_name: str, queue: WriteQueue | None = None
+) -> None:
     """Generate pyproject.toml"""
     content = f"""[project]
 name = "{project_name}"
@@ -323,13 +330,14 @@ strict = false
 warn_return_any = true
 warn_unused_ignores = true
 """
-    create_file(project_dir / "pyproject.toml", content)
+    emit_file(project_dir / "pyproject.toml", content, queue)
 
 
 def generate_project_files(
     project_dir: Path,
     project_name: str,
-    template: str
+    template: str,
+    queue: WriteQueue | None = None,
 ) -> None:
     """
     Create main project files
@@ -338,20 +346,21 @@ def generate_project_files(
         project_dir: Project path
         project_name: Project name
         template: Project template
+        queue: Queue the files (and progress) instead of writing them now
     """
-    print(f"\n{COLORS.colorize('Project files...', COLORS.CYAN)}")
+    emit_line(f"\n{COLORS.colorize('Project files...', COLORS.CYAN)}", queue)
     
-    generate_requirements(project_dir, project_name, template)
-    generate_requirements_dev(project_dir)
-    generate_env_example(project_dir, project_name, template)
-    generate_config_py(project_dir, project_name, template)
-    generate_readme(project_dir, project_name, template)
-    generate_toolkit_version(project_dir)
-    generate_pyproject_toml(project_dir, project_name)
+    generate_requirements(project_dir, project_name, template, queue)
+    generate_requirements_dev(project_dir, queue)
+    generate_env_example(project_dir, project_name, template, queue)
+    generate_config_py(project_dir, project_name, template, queue)
+    generate_readme(project_dir, project_name, template, queue)
+    generate_toolkit_version(project_dir, queue)
+    generate_pyproject_toml(project_dir, project_name, queue)
     
     # Create empty directories
     for d in ["logs", "data", "tests"]:
         (project_dir / d).mkdir(exist_ok=True)
-        create_file(project_dir / d / ".gitkeep", "", quiet=True)
+        emit_file(project_dir / d / ".gitkeep", "", queue, quiet=True)
     
-    print(f"  {COLORS.success('logs/, data/, tests/')}")
+    emit_line(f"  {COLORS.success('logs/, data/, tests/')}", queue)
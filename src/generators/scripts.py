@@ -6,11 +6,13 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from ..core.file_utils import create_file
+from ..core.file_utils import WriteQueue, emit_file, emit_line
 from ..core.constants import COLORS
 
 
-def generate_bootstrap_sh(project_dir: Path, project_name: str) -> None:
+def generate_bootstrap_sh(
+    project_dir: Path, project_name: str, queue: WriteQueue | None = None
+) -> None:
     """Generate bootstrap.sh"""
     content = f"""#!/usr/bin/env bash
 # Bootstrap - {project_name}
@@ -53,10 +55,12 @@ echo ""
 echo "Done!"
 echo "Activate: source $VENV_DIR/bin/activate"
 """
-    create_file(project_dir / "scripts" / "bootstrap.sh", content, executable=True)
+    emit_file(project_dir / "scripts" / "bootstrap.sh", content, queue, executable=True)
 
 
-def generate_bootstrap_ps1(project_dir: Path, project_name: str) -> None:
+def generate_bootstrap_ps1(
+    project_dir: Path, project_name: str, queue: WriteQueue | None = None
+) -> None:
     """Generate bootstrap.ps1 (Windows)"""
     content = f"""# Bootstrap - {project_name} (Windows)
 # Creates venv OUTSIDE project
@@ -92,10 +96,10 @@ Write-Host ""
 Write-Host "Done!"
 Write-Host "Activate: $VenvDir/Scripts/Activate.ps1"
 """
-    create_file(project_dir / "scripts" / "bootstrap.ps1", content)
+    emit_file(project_dir / "scripts" / "bootstrap.ps1", content, queue)
 
 
-def generate_check_repo_clean(project_dir: Path) -> None:
+def generate_check_repo_clean(project_dir: Path, queue: WriteQueue | None = None) -> None:
     """Generate check_repo_clean.sh"""
     content = """#!/usr/bin/env bash
 # Check repo is clean (no venv inside)
@@ -133,10 +137,12 @@ fi
 
 exit $bad
 """
-    create_file(project_dir / "scripts" / "check_repo_clean.sh", content, executable=True)
+    emit_file(project_dir / "scripts" / "check_repo_clean.sh", content, queue, executable=True)
 
 
-def generate_health_check(project_dir: Path, project_name: str) -> None:
+def generate_health_check(
+    project_dir: Path, project_name: str, queue: WriteQueue | None = None
+) -> None:
     """Generate health_check.sh"""
     content = f"""#!/usr/bin/env bash
 # Health Check - {project_name}
@@ -256,10 +262,10 @@ fi
 
 exit $errors
 """
-    create_file(project_dir / "scripts" / "health_check.sh", content, executable=True)
+    emit_file(project_dir / "scripts" / "health_check.sh", content, queue, executable=True)
 
 
-def generate_context_switcher(project_dir: Path) -> None:
+def generate_context_switcher(project_dir: Path, queue: WriteQueue | None = None) -> None:
     """Generate context.py (Context Switcher)"""
     content = '''#!/usr/bin/env python3
 """
@@ -395,24 +401,25 @@ def main():
 if __name__ == "__main__":
     main()
 '''
-    create_file(project_dir / "scripts" / "context.py", content, executable=True)
+    emit_file(project_dir / "scripts" / "context.py", content, queue, executable=True)
 
 
-def generate_scripts(project_dir: Path, project_name: str) -> None:
+def generate_scripts(project_dir: Path, project_name: str, queue: WriteQueue | None = None) -> None:
     """
     Create all scripts
     
     Args:
         project_dir: Project path
         project_name: Project name
+        queue: Queue the files (and progress) instead of writing them now
     """
-    print(f"\n{COLORS.colorize('Scripts...', COLORS.CYAN)}")
+    emit_line(f"\n{COLORS.colorize('Scripts...', COLORS.CYAN)}", queue)
     
     scripts_dir = project_dir / "scripts"
     scripts_dir.mkdir(exist_ok=True)
     
-    generate_bootstrap_sh(project_dir, project_name)
-    generate_bootstrap_ps1(project_dir, project_name)
-    generate_check_repo_clean(project_dir)
-    generate_health_check(project_dir, project_name)
-    generate_context_switcher(project_dir)
+    generate_bootstrap_sh(project_dir, project_name, queue)
+    generate_bootstrap_ps1(project_dir, project_name, queue)
+    generate_check_repo_clean(project_dir, queue)
+    generate_health_check(project_dir, project_name, queue)
+    generate_context_switcher(project_dir, queue)
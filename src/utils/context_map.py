@@ -10,7 +10,7 @@ import os
 from pathlib import Path
 from dataclasses import dataclass, field
 
-from .metrics import parse_cursorignore, should_ignore
+from .metrics import compile_ignore, match_ignore, parse_cursorignore, rel_prefix_len
 
 
 # Directories to always exclude
@@ -195,7 +195,8 @@ def generate_map(root_path: Path) -> str:
     root_path = Path(root_path).resolve()
     
     # Parse ignore patterns
-    ignore_patterns = parse_cursorignore(root_path)
+    ignore_patterns = compile_ignore(parse_cursorignore(root_path))
+    prefix_len = rel_prefix_len(root_path)
     
     # Output lines
     lines = [
@@ -212,33 +213,34 @@ def generate_map(root_path: Path) -> str:
     
     # Walk directory
     for dirpath, dirnames, filenames in os.walk(root_path):
-        current = Path(dirpath)
+        # Child paths are prefix + name: one join per directory, not per file
+        prefix = os.path.join(dirpath, "")
         
-        # Filter directories
+        # Prune directories: name lookup first, then one regex search
         dirnames[:] = [
             d for d in dirnames 
             if d not in EXCLUDE_DIRS
-            and not (ignore_patterns and should_ignore(current / d, root_path, ignore_patterns))
+            and not (ignore_patterns and match_ignore(ignore_patterns, prefix + d, prefix_len))
         ]
         dirnames.sort()
         
         # Process files
         for filename in sorted(filenames):
-            file_path = current / filename
+            file_path = prefix + filename
             
             # Skip ignored files
-            if ignore_patterns and should_ignore(file_path, root_path, ignore_patterns):
+            if ignore_patterns and match_ignore(ignore_patterns, file_path, prefix_len):
                 continue
             
-            rel_path = file_path.relative_to(root_path)
+            rel_path = file_path[prefix_len:]
             
             # Add all files to map
             total_files += 1
             lines.append(f"- `{rel_path}`")
             
             # Parse Python files
-            if file_path.suffix in PARSEABLE_EXTENSIONS:
-                module = parse_python_file(file_path)
+            if os.path.splitext(filename)[1] in PARSEABLE_EXTENSIONS:
+                module = parse_python_file(Path(file_path))
                 
                 if module.has_error:
                     errors += 1
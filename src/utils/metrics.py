@@ -5,16 +5,36 @@
 from __future__ import annotations
 
 import os
+import re
+import codecs
 import fnmatch
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
 
+# Try to import hyperscan for large .cursorignore pattern sets
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
 
 # Directories to always exclude from scanning
 EXCLUDE_DIRS = {".git", ".venv", "venv", "__pycache__", "node_modules", "_AI_ARCHIVE"}
 
-# Binary extensions to skip
-BINARY_EXTENSIONS = {
+# Read size when counting characters
+READ_CHUNK = 128 * 1024
+
+_utf8_decoder = codecs.getincrementaldecoder("utf-8")
+
+# Below this many files, reading serially beats starting a thread pool
+PARALLEL_READ_MIN = 100
+
+# Binary extensions to skip (looked up as name[name.rfind("."):], dot not leading)
+BINARY_EXTENSIONS = frozenset({
     ".pyc", ".pyo", ".pyd", ".so", ".dll", ".exe", ".bin",
     ".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg", ".webp",
     ".woff", ".woff2", ".ttf", ".eot", ".otf",
@@ -22,7 +42,7 @@ BINARY_EXTENSIONS = {
     ".db", ".sqlite", ".sqlite3",
     ".pdf", ".doc", ".docx", ".xls", ".xlsx",
     ".mp3", ".mp4", ".wav", ".avi", ".mov",
-}
+})
 
 
 @dataclass
@@ -31,6 +51,7 @@ class ScanResult:
     files_count: int
     char_count: int
     token_est: int
+    skipped_large: int = 0  # files over the scan's max_bytes
     
     @property
     def formatted_tokens(self) -> str:
@@ -55,20 +76,29 @@ def parse_cursorignore(path: Path) -> list[str]:
     """
     Parse .cursorignore file and return list of patterns
     
+    The parsed file is cached until its mtime or size changes.
+    
     Args:
         path: Path to project root
         
     Returns:
         List of ignore patterns
     """
-    ignore_file = path / ".cursorignore"
+    ignore_file = os.path.join(path, ".cursorignore")
+    try:
+        st = os.stat(ignore_file)
+    except OSError:
+        return []
+    return list(_parse_cursorignore(ignore_file, st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_cursorignore(ignore_file: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Patterns of one version of ignore_file (mtime_ns and size key the cache)"""
     patterns = []
-    
-    if not ignore_file.exists():
-        return patterns
-    
     try:
-        content = ignore_file.read_text(encoding="utf-8")
+        with open(ignore_file, encoding="utf-8") as f:
+            content = f.read()
         for line in content.splitlines():
             line = line.strip()
             if not line or line.startswith("#") or line.startswith("!"):
@@ -76,18 +106,182 @@ def parse_cursorignore(path: Path) -> list[str]:
             patterns.append(line)
     except Exception:
         pass
+    return tuple(patterns)
+
+
+# fnmatch folds case (and separators) on Windows; literal checks never do
+_GLOB_FLAGS = "(?si:" if os.path.normcase("A") == "a" else "(?s:"
+
+
+def _glob_part(pattern: str) -> str | None:
+    """
+    Regex for pattern matched against a single path component
     
-    return patterns
+    Like fnmatch.translate, but nothing crosses "/". None when the pattern
+    holds a literal "/" and so can never match one component.
+    """
+    res = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == "*":
+            res.append("[^/]*")
+        elif c == "?":
+            res.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and pattern[j] == "!":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                res.append("\\[")
+            else:
+                # Let fnmatch translate the set, then keep it off "/"
+                res.append("(?!/)" + fnmatch.translate(pattern[i - 1:j + 1])[4:-3])
+                i = j + 1
+        elif c == "/":
+            return None
+        else:
+            res.append(re.escape(c))
+    return _GLOB_FLAGS + "".join(res) + ")"
+
+
+# Regex constructs Hyperscan rejects: lookarounds, atomic groups, backrefs
+_HS_UNSUPPORTED = ("(?!", "(?=", "(?>", "(?P")
+
+
+class HyperscanIgnore:
+    """
+    compile_ignore() result matched by a Hyperscan database
+    
+    All patterns are scanned in one pass over the path, however many there
+    are. Alternatives Hyperscan can't compile go into a residual regex, and
+    non-ASCII paths (where bytes and characters differ) use the full regex.
+    Only search() is offered, which is all should_ignore() needs.
+    """
+    
+    def __init__(self, alternatives: list[str]):
+        supported = [a for a in alternatives if not any(c in a for c in _HS_UNSUPPORTED)]
+        rest = [a for a in alternatives if any(c in a for c in _HS_UNSUPPORTED)]
+        
+        self.regex = re.compile("|".join(alternatives))
+        self.rest = re.compile("|".join(rest)) if rest else None
+        self.db = None
+        if supported:
+            self.db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            self.db.compile(
+                expressions=[a.encode("utf-8") for a in supported],
+                ids=list(range(len(supported))),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY] * len(supported),
+            )
+        # Scratch space can't be shared between threads scanning at once
+        self._local = threading.local()
+    
+    def search(self, path: str) -> bool | None:
+        """True when path matches, else None (like re.Pattern.search)"""
+        if self.db is None or not path.isascii():
+            return True if self.regex.search(path) else None
+        
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self.db)
+        try:
+            # Returning True stops the scan at the first match
+            self.db.scan(path.encode("ascii"), match_event_handler=_stop_scan, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            return True
+        if self.rest is not None and self.rest.search(path):
+            return True
+        return None
+
+
+def _stop_scan(*_args) -> bool:
+    return True
 
 
-def should_ignore(path: Path, root: Path, patterns: list[str]) -> bool:
+def compile_ignore(patterns: list[str]) -> re.Pattern[str] | HyperscanIgnore | None:
+    """
+    Union .cursorignore patterns into one matcher
+    
+    Searched against a path relative to the root, with "/" separators, it
+    matches exactly the paths the pattern rules below ignore. This is a
+    regex, or a HyperscanIgnore when AI_TOOLKIT_HYPERSCAN=1 is set and
+    hyperscan is installed.
+    
+    Args:
+        patterns: Patterns from parse_cursorignore()
+        
+    Returns:
+        Compiled matcher, or None when there are no patterns
+    """
+    return _compile_ignore(tuple(patterns), _use_hyperscan())
+
+
+def _use_hyperscan() -> bool:
+    """Hyperscan matching is opt-in: hyperscan installed and AI_TOOLKIT_HYPERSCAN=1"""
+    return HAS_HYPERSCAN and os.environ.get("AI_TOOLKIT_HYPERSCAN") == "1"
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_ignore(
+    patterns: tuple[str, ...], use_hyperscan: bool
+) -> re.Pattern[str] | HyperscanIgnore | None:
+    """compile_ignore(), cached per pattern tuple"""
+    if not patterns:
+        return None
+    
+    alternatives = _ignore_alternatives(patterns)
+    if use_hyperscan:
+        try:
+            return HyperscanIgnore(alternatives)
+        except hyperscan.error:
+            pass  # fall back to the regex union
+    return re.compile("|".join(alternatives))
+
+
+def _ignore_alternatives(patterns: tuple[str, ...]) -> list[str]:
+    """One regex per way a pattern can match a relative path"""
+    alternatives = []
+    for pattern in patterns:
+        # Directory patterns (ending with /): name glob, or literal path prefix
+        if pattern.endswith("/"):
+            dir_pattern = pattern.rstrip("/")
+            part = _glob_part(dir_pattern)
+            if part is not None:
+                alternatives.append(f"(?:^|/){part}\\Z")
+            alternatives.append(f"^{re.escape(dir_pattern)}(?:/|\\Z)")
+        
+        # ** patterns (recursive): any component
+        if pattern.startswith("**/"):
+            part = _glob_part(pattern[3:])
+            if part is not None:
+                alternatives.append(f"(?:^|/){part}(?:/|\\Z)")
+        
+        # Direct match against the name or the whole relative path
+        part = _glob_part(pattern)
+        if part is not None:
+            alternatives.append(f"(?:^|/){part}\\Z")
+        alternatives.append("^" + _GLOB_FLAGS + fnmatch.translate(pattern)[4:])
+        
+        # Plain name: any directory in the path
+        if "*" not in pattern and "/" not in pattern:
+            alternatives.append(f"(?:^|/){re.escape(pattern)}(?:/|\\Z)")
+    
+    return alternatives
+
+
+def should_ignore(path: Path, root: Path, patterns: list[str] | re.Pattern[str] | HyperscanIgnore) -> bool:
     """
     Check if a path should be ignored based on patterns
     
     Args:
         path: File or directory path
         root: Project root path
-        patterns: List of ignore patterns
+        patterns: List of ignore patterns, or the matcher from compile_ignore()
         
     Returns:
         True if path should be ignored
@@ -99,48 +293,240 @@ def should_ignore(path: Path, root: Path, patterns: list[str]) -> bool:
         rel_path = path.relative_to(root)
     except ValueError:
         return False
+    if not rel_path.parts:
+        return False  # the root itself
     
-    rel_str = str(rel_path)
-    name = path.name
+    if isinstance(patterns, list):
+        patterns = compile_ignore(patterns)
+    return patterns.search(rel_path.as_posix()) is not None
+
+
+def _count_chars(path: str | int) -> int:
+    """
+    Characters read_text(encoding="utf-8", errors="ignore") would return
     
-    for pattern in patterns:
-        # Handle directory patterns (ending with /)
-        if pattern.endswith("/"):
-            dir_pattern = pattern.rstrip("/")
-            if fnmatch.fnmatch(name, dir_pattern):
-                return True
-            if rel_str.startswith(dir_pattern + "/") or rel_str == dir_pattern:
-                return True
-        
-        # Handle ** patterns (recursive)
-        if pattern.startswith("**/"):
-            sub_pattern = pattern[3:]
-            if fnmatch.fnmatch(name, sub_pattern):
-                return True
-            for part in rel_path.parts:
-                if fnmatch.fnmatch(part, sub_pattern):
-                    return True
-        
-        # Direct pattern match
-        if fnmatch.fnmatch(name, pattern):
-            return True
-        if fnmatch.fnmatch(rel_str, pattern):
-            return True
-        
-        # Check if pattern matches any directory in path
-        if "*" not in pattern and "/" not in pattern:
-            if pattern in rel_path.parts:
-                return True
+    Read raw in READ_CHUNK pieces. ASCII chunks are counted on the bytes,
+    with no decoding; only other chunks go through the UTF-8 decoder. CRLF
+    counts as one character, as universal newlines make it.
+    """
+    decoder = _utf8_decoder("ignore")
+    count = 0
+    last_cr = False  # previous chunk ended in "\r"
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            chunk = f.read(READ_CHUNK)
+            if not chunk:
+                return count
+            if chunk.isascii() and not decoder.getstate()[0]:
+                count += len(chunk) - chunk.count(b"\r\n")
+                if last_cr and chunk[0] == 0x0A:
+                    count -= 1
+                last_cr = chunk[-1] == 0x0D
+            else:
+                text = decoder.decode(chunk)
+                if not text:
+                    continue
+                count += len(text) - text.count("\r\n")
+                if last_cr and text[0] == "\n":
+                    count -= 1
+                last_cr = text[-1] == "\r"
+
+
+def _try_count_chars(path: str | int) -> int | None:
+    """_count_chars(), or None when the file can't be read"""
+    try:
+        return _count_chars(path)
+    except (PermissionError, OSError, UnicodeDecodeError):
+        return None
+
+
+def rel_prefix_len(root: str | Path) -> int:
+    """Length of root plus a separator: path[n:] is then relative to root"""
+    return len(os.path.join(os.fspath(root), ""))
+
+
+def match_ignore(regex: re.Pattern[str] | HyperscanIgnore, path: str, prefix_len: int) -> bool:
+    """
+    should_ignore() for a path string under the root, without relative_to()
     
-    return False
+    Args:
+        regex: From compile_ignore()
+        path: File or directory path, starting with the root
+        prefix_len: rel_prefix_len(root)
+    """
+    rel = path[prefix_len:]
+    if os.sep != "/":
+        rel = rel.replace(os.sep, "/")
+    return regex.search(rel) is not None
 
 
-def scan_project(path: Path) -> ScanResult:
+def _read_counts(pool: ThreadPoolExecutor, func, items: list) -> list[int | None]:
+    """func over items, on the pool when there are enough to pay for it"""
+    # Reads block in the OS with the GIL released, so overlap them
+    if len(items) < PARALLEL_READ_MIN:
+        return list(map(func, items))
+    return list(pool.map(func, items))
+
+
+def _try_count_chars_at(item: tuple[int, str]) -> int | None:
+    """_try_count_chars() for a name relative to an open directory fd"""
+    dir_fd, name = item
+    try:
+        fd = os.open(name, os.O_RDONLY, dir_fd=dir_fd)
+    except OSError:
+        return None
+    return _try_count_chars(fd)
+
+
+# Directory fds scan_project holds open between reads
+MAX_HELD_DIRS = 64
+
+# os.fwalk and dir_fd opens: POSIX only
+HAVE_FWALK = hasattr(os, "fwalk") and os.open in os.supports_dir_fd
+
+
+def _scan_fwalk(
+    root: str,
+    ignore_patterns: re.Pattern[str] | HyperscanIgnore | None,
+    prefix_len: int,
+    max_bytes: int | None,
+    pool: ThreadPoolExecutor,
+) -> tuple[list[int | None], int]:
+    """
+    Walk with os.fwalk, opening and stat-ing files relative to each
+    directory's fd instead of resolving full paths from the root
+    
+    Returns:
+        Character counts (None for unreadable files) and skipped_large
+    """
+    counts: list[int | None] = []
+    skipped_large = 0
+    pending: list[tuple[int, str]] = []  # (dup of a directory fd, file name)
+    held: list[int] = []  # the dups, closed once pending is read
+    
+    def flush() -> None:
+        try:
+            counts.extend(_read_counts(pool, _try_count_chars_at, pending))
+        finally:
+            for fd in held:
+                os.close(fd)
+            pending.clear()
+            held.clear()
+    
+    try:
+        for dirpath, dirnames, filenames, dfd in os.fwalk(root):
+            # Child paths are prefix + name: one join per directory, not per file
+            prefix = os.path.join(dirpath, "")
+            
+            # Filter out excluded directories in place; symlinks are not followed
+            dirnames[:] = [
+                d for d in dirnames
+                if d not in EXCLUDE_DIRS
+                and not (ignore_patterns and match_ignore(ignore_patterns, prefix + d, prefix_len))
+            ]
+            
+            names = []
+            for name in filenames:
+                # Cheapest checks first: extension set, ignore regex, size
+                dot = name.rfind(".")
+                if dot > 0 and name[dot:].lower() in BINARY_EXTENSIONS:
+                    continue
+                
+                if ignore_patterns and match_ignore(ignore_patterns, prefix + name, prefix_len):
+                    continue
+                
+                if max_bytes is not None:
+                    try:
+                        if os.stat(name, dir_fd=dfd).st_size > max_bytes:
+                            skipped_large += 1
+                            continue
+                    except OSError:
+                        continue
+                
+                names.append(name)
+            
+            if names:
+                # fwalk closes dfd when it moves on; keep a copy for the reads
+                fd = os.dup(dfd)
+                held.append(fd)
+                pending.extend((fd, name) for name in names)
+                if len(held) >= MAX_HELD_DIRS:
+                    flush()
+    finally:
+        flush()
+    
+    return counts, skipped_large
+
+
+def _scan_scandir(
+    root: str,
+    ignore_patterns: re.Pattern[str] | HyperscanIgnore | None,
+    prefix_len: int,
+    max_bytes: int | None,
+    pool: ThreadPoolExecutor,
+) -> tuple[list[int | None], int]:
+    """
+    Walk with os.scandir, reading files by full path
+    
+    Returns:
+        Character counts (None for unreadable files) and skipped_large
+    """
+    skipped_large = 0
+    candidates: list[str] = []  # files to read
+    
+    # os.scandir walk: is_dir() comes from the DirEntry cache, no extra stat
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if is_dir:
+                    # Filter out excluded directories; symlinks are not followed
+                    if (
+                        entry.name not in EXCLUDE_DIRS
+                        and not entry.is_symlink()
+                        and not (ignore_patterns and match_ignore(ignore_patterns, entry.path, prefix_len))
+                    ):
+                        stack.append(entry.path)
+                    continue
+                
+                # Cheapest checks first: extension set, ignore regex, size
+                name = entry.name
+                dot = name.rfind(".")
+                if dot > 0 and name[dot:].lower() in BINARY_EXTENSIONS:
+                    continue
+                
+                if ignore_patterns and match_ignore(ignore_patterns, entry.path, prefix_len):
+                    continue
+                
+                if max_bytes is not None:
+                    try:
+                        if entry.stat().st_size > max_bytes:
+                            skipped_large += 1
+                            continue
+                    except OSError:
+                        continue
+                
+                candidates.append(entry.path)
+    
+    return _read_counts(pool, _try_count_chars, candidates), skipped_large
+
+
+def scan_project(path: Path, max_bytes: int | None = None) -> ScanResult:
     """
     Scan project and return metrics
     
     Args:
         path: Path to project root
+        max_bytes: Skip (and count in skipped_large) files larger than this
         
     Returns:
         ScanResult with files_count, char_count, token_est
@@ -151,44 +537,29 @@ def scan_project(path: Path) -> ScanResult:
         return ScanResult(files_count=0, char_count=0, token_est=0)
     
     # Parse ignore patterns if present
-    ignore_patterns = parse_cursorignore(path)
+    ignore_patterns = compile_ignore(parse_cursorignore(path))
+    
+    # Root-relative path of a file is a slice of its full path, no relative_to()
+    root = os.fspath(path)
+    prefix_len = rel_prefix_len(root)
+    
+    # Worker threads only start if a batch is big enough to use them
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        scan = _scan_fwalk if HAVE_FWALK else _scan_scandir
+        counts, skipped_large = scan(root, ignore_patterns, prefix_len, max_bytes, pool)
     
     files_count = 0
     char_count = 0
-    
-    for dirpath, dirnames, filenames in os.walk(path):
-        current = Path(dirpath)
-        
-        # Filter out excluded directories (in-place)
-        dirnames[:] = [
-            d for d in dirnames 
-            if d not in EXCLUDE_DIRS
-            and not (ignore_patterns and should_ignore(current / d, path, ignore_patterns))
-        ]
-        
-        for filename in filenames:
-            file_path = current / filename
-            
-            # Skip if ignored by patterns
-            if ignore_patterns and should_ignore(file_path, path, ignore_patterns):
-                continue
-            
-            # Skip binary files
-            ext = file_path.suffix.lower()
-            if ext in BINARY_EXTENSIONS:
-                continue
-            
-            # Try to read file
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-                files_count += 1
-                char_count += len(content)
-            except (PermissionError, OSError, UnicodeDecodeError):
-                continue
+    for count in counts:
+        # Unreadable files are skipped
+        if count is not None:
+            files_count += 1
+            char_count += count
     
     return ScanResult(
         files_count=files_count,
         char_count=char_count,
-        token_est=char_count // 4
+        token_est=char_count // 4,
+        skipped_large=skipped_large,
     )
-
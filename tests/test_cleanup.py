@@ -2,10 +2,22 @@
 Tests for cleanup command
 """
 
+import tarfile
+
 import pytest
 from pathlib import Path
 
-from src.commands.cleanup import analyze_project, cleanup_project, Issue
+from src.commands import cleanup
+from src.commands.cleanup import (
+    analyze_project,
+    cleanup_project,
+    cmd_cleanup,
+    create_backup,
+    scan_project,
+    select_cleanup_level,
+    _tail_lines,
+    Issue,
+)
 
 
 class TestAnalyzeProject:
@@ -60,6 +72,34 @@ class TestAnalyzeProject:
         assert len(venv_issues) == 0
 
 
+class TestScanProject:
+    """Tests for the single-pass project scan"""
+
+    def test_collects_everything_in_one_walk(self, tmp_path):
+        """venv, logs, data and __pycache__ are found together"""
+        (tmp_path / "venv" / "bin").mkdir(parents=True)
+        (tmp_path / "venv" / "lib" / "site-packages").mkdir(parents=True)
+        (tmp_path / "logs").mkdir()
+        (tmp_path / "logs" / "app.log").write_bytes(b"x" * 1024)
+        (tmp_path / "data" / "raw").mkdir(parents=True)
+        (tmp_path / "data" / "raw" / "a.csv").write_bytes(b"x" * 2048)
+        (tmp_path / "src" / "__pycache__").mkdir(parents=True)
+        (tmp_path / "__pycache__").mkdir()
+        
+        scan = scan_project(tmp_path)
+        
+        assert scan.venvs == [tmp_path / "venv"]
+        # site-packages inside a venv belongs to that venv
+        assert scan.site_packages == []
+        assert [log.name for log, _ in scan.logs] == ["app.log"]
+        assert scan.data_size_mb == pytest.approx(2048 / (1024 * 1024))
+        assert len(scan.pycache) == 2
+
+    def test_no_data_dir(self, tmp_path):
+        """Missing data/ is reported as None"""
+        assert scan_project(tmp_path).data_size_mb is None
+
+
 class TestCleanupProject:
     """Tests for project cleanup"""
 
@@ -93,6 +133,126 @@ class TestCleanupProject:
         
         assert not pycache.exists()
 
+    def test_uses_given_issues(self, tmp_path):
+        """Pre-computed issues are acted on without re-analyzing"""
+        project = tmp_path / "proj"
+        pycache = project / "__pycache__"
+        pycache.mkdir(parents=True)
+        issues = analyze_project(project)
+        
+        # Created after analysis: not part of the given issues
+        late = project / "pkg" / "__pycache__"
+        late.mkdir(parents=True)
+        
+        assert cleanup_project(project, "medium", issues) is True
+        assert not pycache.exists()
+        assert late.exists()
+
+
+    def test_backup_failure_stops_cleanup(self, tmp_path, monkeypatch, capsys):
+        """A failed backup is reported and nothing after the join runs"""
+        project = tmp_path / "proj"
+        project.mkdir()
+        
+        def fail(tar, path, arcname):
+            raise PermissionError(path)
+        
+        monkeypatch.setattr(cleanup, "_add_tree", fail)
+        assert cleanup_project(project, "medium", []) is False
+        
+        assert "Backup failed" in capsys.readouterr().out
+        assert not (project / ".cursorrules").exists()
+
+    def test_backup_progress_follows_venv_output(self, tmp_path, capsys):
+        """Backup lines are printed after the join, not amid the venv moves"""
+        project = tmp_path / "proj"
+        (project / "venv" / "bin").mkdir(parents=True)
+        issues = analyze_project(project)
+        
+        assert cleanup_project(project, "medium", issues) is True
+        
+        out = capsys.readouterr().out
+        assert out.index("Moving venv/") < out.index("Creating backup") < out.index("Backup created")
+
+
+class TestCreateBackup:
+    """Tests for the pre-cleanup backup"""
+
+    def test_skips_junk_directories(self, tmp_path):
+        """venv/ and __pycache__/ are left out of the archive"""
+        project = tmp_path / "proj"
+        (project / "venv" / "bin").mkdir(parents=True)
+        (project / "venv" / "bin" / "python").write_text("x")
+        (project / "__pycache__").mkdir()
+        (project / "main.py").write_text("print()")
+        
+        backup = create_backup(project)
+        
+        with tarfile.open(backup) as tar:
+            names = tar.getnames()
+        assert "proj/main.py" in names
+        assert not any("venv" in n or "__pycache__" in n for n in names)
+
+    def test_tolerates_entries_removed_meanwhile(self, tmp_path, monkeypatch):
+        """Files removed while the archive is written are skipped, not fatal"""
+        project = tmp_path / "proj"
+        (project / "sub").mkdir(parents=True)
+        (project / "a.txt").write_text("a")
+        (project / "b.txt").write_text("b")
+        (project / "sub" / "c.txt").write_text("c")
+        
+        add = tarfile.TarFile.add
+        
+        def add_then_remove(self, name, *args, **kwargs):
+            add(self, name, *args, **kwargs)
+            if name.endswith("a.txt"):
+                (project / "b.txt").unlink()
+        
+        monkeypatch.setattr(tarfile.TarFile, "add", add_then_remove)
+        backup = create_backup(project)
+        
+        with tarfile.open(backup) as tar:
+            names = tar.getnames()
+        assert "proj/a.txt" in names
+        assert "proj/sub/c.txt" in names
+        assert "proj/b.txt" not in names
+
+    def test_failed_backup_leaves_no_archive(self, tmp_path, monkeypatch):
+        """A backup that fails midway is removed"""
+        project = tmp_path / "proj"
+        project.mkdir()
+        (project / "main.py").write_text("print()")
+        
+        def fail(tar, path, arcname):
+            raise PermissionError(path)
+        
+        monkeypatch.setattr(cleanup, "_add_tree", fail)
+        with pytest.raises(PermissionError):
+            create_backup(project)
+        
+        assert [p.name for p in tmp_path.iterdir()] == ["proj"]
+
+
+class TestTailLines:
+    """Tests for reading the end of a log"""
+
+    def test_keeps_last_lines(self, tmp_path):
+        """Only the last n lines survive, across block boundaries"""
+        log = tmp_path / "big.log"
+        log.write_bytes(b"".join(b"line %d\n" % i for i in range(5000)))
+        
+        tail = _tail_lines(log, 1000, block_size=64)
+        
+        assert tail.splitlines() == [b"line %d" % i for i in range(4000, 5000)]
+        assert tail.endswith(b"\n")
+
+    def test_short_file_returned_whole(self, tmp_path):
+        """Files with fewer than n lines are returned unchanged"""
+        log = tmp_path / "small.log"
+        log.write_bytes(b"a\nb")
+        
+        assert _tail_lines(log, 1000) == b"a\nb"
+
 
 class TestIssueClass:
     """Tests for Issue class"""
@@ -136,3 +296,26 @@ class TestIssueClass:
         assert "❌" in str(error)
         assert "⚠️" in str(warning)
         assert "ℹ️" in str(info)
+
+
+class TestCmdCleanup:
+    """Tests for the cleanup command entry point"""
+
+    def test_path_and_level_skip_prompts(self, tmp_path, monkeypatch):
+        """Given path and level, nothing is read from stdin"""
+        (tmp_path / "__pycache__").mkdir()
+        
+        def no_input(prompt=""):
+            raise AssertionError(f"unexpected prompt: {prompt}")
+        
+        monkeypatch.setattr("builtins.input", no_input)
+        cmd_cleanup(tmp_path, "safe")
+        
+        assert (tmp_path / "__pycache__").exists()
+
+    def test_level_prompt_rejects_non_decimal_digits(self, monkeypatch):
+        """Input like '²' is re-prompted instead of crashing"""
+        answers = iter(["²", "x", "1"])
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+        
+        assert select_cleanup_level() == "safe"
@@ -7,7 +7,7 @@ from pathlib import Path
 
 from src.core.constants import COLORS, VERSION, TEMPLATES, IDE_CONFIGS, CLEANUP_LEVELS
 from src.core.config import get_config, set_default_ide, get_default_ide, get_default_ai_targets
-from src.core.file_utils import create_file, make_executable, get_dir_size
+from src.core.file_utils import WriteQueue, create_file, create_files_batch, emit_file, emit_line, make_dirs, make_executable, get_dir_size
 
 
 class TestColors:
@@ -117,6 +117,36 @@ class TestFileUtils:
         assert path.exists()
         assert path.read_text() == "content\n"
 
+    def test_create_file_bytes(self, tmp_path):
+        """Create file from pre-encoded bytes"""
+        path = tmp_path / "test.txt"
+        create_file(path, "контент".encode("utf-8"))
+        
+        assert path.read_text(encoding="utf-8") == "контент\n"
+
+    def test_create_file_platform_newlines(self, tmp_path, monkeypatch):
+        """Newlines are written as text mode would, e.g. CRLF on Windows"""
+        monkeypatch.setattr("src.core.file_utils._NEWLINE", b"\r\n")
+        create_file(tmp_path / "a.md", "a\nb")
+        create_file(tmp_path / "b.md", b"c")
+        
+        assert (tmp_path / "a.md").read_bytes() == b"a\r\nb\r\n"
+        assert (tmp_path / "b.md").read_bytes() == b"c\r\n"
+
+    def test_create_executable_keeps_existing_mode(self, tmp_path):
+        """Rewriting an existing file only adds the execute bits"""
+        import os
+        import stat
+        if os.name == "nt":
+            pytest.skip("POSIX modes")
+        path = tmp_path / "run.sh"
+        path.write_text("old")
+        os.chmod(path, 0o600)
+        
+        create_file(path, "#!/bin/sh", executable=True, quiet=True)
+        
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o711
+
     def test_create_file_creates_dirs(self, temp_dir):
         """Create file creates directories"""
         path = temp_dir / "a" / "b" / "c" / "test.txt"
@@ -124,6 +154,75 @@ class TestFileUtils:
         
         assert path.exists()
 
+    def test_create_file_skip_parent_mkdir(self, tmp_path):
+        """Skipping the parent mkdir needs an existing parent"""
+        create_file(tmp_path / "test.txt", "content", skip_parent_mkdir=True)
+        assert (tmp_path / "test.txt").exists()
+        
+        with pytest.raises(FileNotFoundError):
+            create_file(tmp_path / "missing" / "test.txt", "content", skip_parent_mkdir=True)
+
+    def test_create_files_batch(self, tmp_path):
+        """Batch writes every file, executables included"""
+        import os
+        import stat
+        files = [(tmp_path / f"f{i}.txt", f"content {i}", False) for i in range(5)]
+        files.append((tmp_path / "run.sh", "#!/bin/bash", True))
+        create_files_batch(files, quiet=True)
+        
+        assert (tmp_path / "f3.txt").read_text() == "content 3\n"
+        assert os.stat(tmp_path / "run.sh").st_mode & stat.S_IXUSR
+
+    def test_create_files_batch_relative_to_root(self, tmp_path):
+        """With root and existing parents, files land in the same place"""
+        (tmp_path / "pkg").mkdir()
+        files = [(tmp_path / "pkg" / "a.py", "a", False), (tmp_path / "b.py", "b", False)]
+        create_files_batch(files, quiet=True, skip_parent_mkdir=True, root=tmp_path)
+        
+        assert (tmp_path / "pkg" / "a.py").read_text() == "a\n"
+        assert (tmp_path / "b.py").read_text() == "b\n"
+
+    def test_write_queue(self, tmp_path, capsys):
+        """Queued files appear on flush, progress printed in order"""
+        queue = WriteQueue(root=tmp_path, skip_parent_mkdir=True)
+        queue.echo("Section")
+        queue.add(tmp_path / "a.txt", "a")
+        
+        assert not (tmp_path / "a.txt").exists()
+        queue.flush()
+        
+        assert (tmp_path / "a.txt").read_text() == "a\n"
+        out = capsys.readouterr().out
+        assert out.index("Section") < out.index("a.txt")
+
+    def test_emit_to_queue(self, tmp_path, capsys):
+        """emit_file/emit_line queue when given a queue, act at once otherwise"""
+        queue = WriteQueue(root=tmp_path, skip_parent_mkdir=True)
+        emit_line("Stage", queue)
+        emit_file(tmp_path / "a.txt", "a", queue)
+        emit_file(tmp_path / ".gitkeep", "", queue, quiet=True)
+        
+        assert capsys.readouterr().out == ""
+        assert not (tmp_path / "a.txt").exists()
+        queue.flush()
+        
+        out = capsys.readouterr().out
+        assert out.index("Stage") < out.index("a.txt")
+        assert ".gitkeep" not in out
+        assert (tmp_path / ".gitkeep").exists()
+        
+        emit_file(tmp_path / "b.txt", "b")
+        assert "b.txt" in capsys.readouterr().out
+
+    def test_make_dirs(self, tmp_path):
+        """Make dirs creates parents and tolerates existing ones"""
+        (tmp_path / "bot").mkdir()
+        make_dirs(tmp_path, ["bot/handlers", "bot/utils", ".github/workflows"])
+        
+        assert (tmp_path / "bot" / "handlers").is_dir()
+        assert (tmp_path / "bot" / "utils").is_dir()
+        assert (tmp_path / ".github" / "workflows").is_dir()
+
     def test_create_executable(self, temp_dir):
         """Create executable file"""
         path = temp_dir / "test.sh"
@@ -5,7 +5,8 @@ Tests for create command
 import pytest
 from pathlib import Path
 
-from src.commands.create import create_project
+from src.commands.create import cmd_create, create_project, generate_module_files, scaffold_dirs
+from src.core.file_utils import WriteQueue, make_dirs
 from src.core.config import set_default_ide
 
 
@@ -245,3 +246,38 @@ class TestProjectStructure:
         project_dir = temp_dir / "test"
         assert (project_dir / "requirements.txt").exists()
         assert (project_dir / "requirements-dev.txt").exists()
+
+    def test_full_modules_written_in_one_batch(self, tmp_path):
+        """All modules of the full template are queued, then written together"""
+        project_dir = tmp_path / "test"
+        project_dir.mkdir()
+        make_dirs(project_dir, scaffold_dirs("full", include_ci=False))
+        queue = WriteQueue(root=project_dir, skip_parent_mkdir=True)
+        
+        generate_module_files(project_dir, "test", "full", queue)
+        assert not (project_dir / "bot" / "main.py").exists()
+        
+        queue.flush()
+        for rel in ("bot/main.py", "database/db.py", "api/main.py", "webapp/index.html", "parser/scraper.py"):
+            assert (project_dir / rel).is_file()
+
+
+class TestCmdCreate:
+    """Tests for the create command entry point"""
+
+    def test_all_options_given_skips_prompts(self, tmp_path, monkeypatch):
+        """Nothing is read from stdin when every option is passed"""
+        def no_input(prompt=""):
+            raise AssertionError(f"unexpected prompt: {prompt}")
+        
+        monkeypatch.setattr("builtins.input", no_input)
+        cmd_create(
+            name="scripted",
+            path=tmp_path,
+            template="parser",
+            include_docker=False,
+            include_ci=False,
+            include_git=False,
+        )
+        
+        assert (tmp_path / "scripted" / "parser" / "scraper.py").exists()
@@ -39,6 +39,23 @@ class TestHealthCheck:
         # Depends on other factors
 
 
+class TestHealthCheckOutput:
+    """Tests for where the report goes"""
+
+    def test_writer_gets_plain_report(self, tmp_path, capsys):
+        """writer receives the report; color=False leaves no ANSI codes"""
+        import io
+        buffer = io.StringIO()
+        
+        health_check(tmp_path, writer=buffer, color=False)
+        
+        output = buffer.getvalue()
+        assert "Health Check" in output
+        assert "[ERROR] _AI_INCLUDE/ missing" in output
+        assert "\x1b[" not in output
+        assert capsys.readouterr().out == ""
+
+
 class TestHealthCheckFiles:
     """Tests for individual file checks"""
 
@@ -0,0 +1,151 @@
+"""
+Tests for project metrics scanning.
+"""
+
+import re
+
+import pytest
+
+from src.utils import metrics
+from src.utils.metrics import (
+    scan_project,
+    compile_ignore,
+    match_ignore,
+    rel_prefix_len,
+    parse_cursorignore,
+    should_ignore,
+    ScanResult,
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A small project with ignored, excluded and binary files."""
+    files = {
+        "main.py": "print('hi')\n",
+        "README.txt": "read me\n",
+        "logo.png": "not really a png",
+        "notes.tmp": "scratch",
+        "logs/app.log": "log line\n",
+        "src/app.py": "x = 1\n",
+        "src/pkg/mod.py": "y = 2\n",
+        "venv/lib.py": "venv code\n",
+        "node_modules/dep.js": "module.exports = {}\n",
+    }
+    for rel, content in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    (tmp_path / ".cursorignore").write_text("# comment\nlogs/\n*.tmp\n!keep.tmp\n")
+    return tmp_path
+
+
+class TestParseCursorignore:
+    def test_skips_comments_and_negations(self, project):
+        assert parse_cursorignore(project) == ["logs/", "*.tmp"]
+
+    def test_missing_file(self, tmp_path):
+        assert parse_cursorignore(tmp_path) == []
+
+    def test_reparsed_after_edit(self, project):
+        assert parse_cursorignore(project) == ["logs/", "*.tmp"]
+        
+        (project / ".cursorignore").write_text("build/\n")
+        assert parse_cursorignore(project) == ["build/"]
+
+    def test_returns_fresh_list(self, project):
+        parse_cursorignore(project).append("mutated")
+        assert parse_cursorignore(project) == ["logs/", "*.tmp"]
+
+
+class TestShouldIgnore:
+    def test_directory_pattern(self, project):
+        assert should_ignore(project / "logs", project, ["logs/"])
+
+    def test_glob_pattern(self, project):
+        assert should_ignore(project / "notes.tmp", project, ["*.tmp"])
+
+    def test_recursive_pattern(self, project):
+        assert should_ignore(project / "src" / "pkg" / "mod.py", project, ["**/pkg"])
+
+    def test_no_match(self, project):
+        assert not should_ignore(project / "src" / "app.py", project, ["logs/", "*.tmp"])
+
+    def test_wildcard_stays_in_component(self, project):
+        """A name glob must not match across directories"""
+        assert not should_ignore(project / "src" / "pkg" / "mod.py", project, ["pkg*"])
+        assert should_ignore(project / "src" / "pkg" / "mod.py", project, ["src/*.py"])
+
+    def test_compiled_patterns_agree(self, project):
+        patterns = ["logs/", "*.tmp", "**/pkg", "src/app.py", "venv"]
+        regex = compile_ignore(patterns)
+        for rel in ("logs", "notes.tmp", "src/pkg/mod.py", "src/app.py", "venv/lib.py", "main.py"):
+            path = project / rel
+            assert should_ignore(path, project, regex) == should_ignore(path, project, patterns)
+
+    def test_match_ignore_on_path_strings(self, project):
+        regex = compile_ignore(["logs/", "*.tmp"])
+        prefix_len = rel_prefix_len(project)
+        assert match_ignore(regex, str(project / "logs"), prefix_len)
+        assert match_ignore(regex, str(project / "src" / "x.tmp"), prefix_len)
+        assert not match_ignore(regex, str(project / "src" / "app.py"), prefix_len)
+
+    def test_regex_by_default(self, monkeypatch):
+        monkeypatch.delenv("AI_TOOLKIT_HYPERSCAN", raising=False)
+        assert isinstance(compile_ignore(["logs/", "*.tmp"]), re.Pattern)
+
+    @pytest.mark.skipif(not metrics.HAS_HYPERSCAN, reason="hyperscan not installed")
+    def test_hyperscan_agrees_with_regex(self, project, monkeypatch):
+        monkeypatch.setenv("AI_TOOLKIT_HYPERSCAN", "1")
+        patterns = ["logs/", "*.tmp", "**/pkg", "src/a[!b]p.py", "venv", "*"]
+        matcher = compile_ignore(patterns)
+        assert isinstance(matcher, metrics.HyperscanIgnore)
+        for rel in ("logs", "notes.tmp", "src/pkg/mod.py", "src/app.py", "venv/lib.py", "main.py", "é.py"):
+            assert bool(matcher.search(rel)) == bool(matcher.regex.search(rel))
+    
+    def test_compile_empty(self):
+        assert compile_ignore([]) is None
+
+
+class TestScanProject:
+    def test_counts_text_files(self, project):
+        result = scan_project(project)
+
+        # main.py, README.txt, src/app.py, src/pkg/mod.py, .cursorignore
+        assert result.files_count == 5
+        expected = sum(
+            len((project / rel).read_text())
+            for rel in ("main.py", "README.txt", "src/app.py", "src/pkg/mod.py", ".cursorignore")
+        )
+        assert result.char_count == expected
+        assert result.token_est == expected // 4
+
+    def test_many_files_read_in_parallel(self, tmp_path):
+        for i in range(150):
+            (tmp_path / f"f{i}.txt").write_text("x" * i)
+        
+        result = scan_project(tmp_path)
+        assert result.files_count == 150
+        assert result.char_count == sum(range(150))
+
+    def test_max_bytes_skips_large_files(self, tmp_path):
+        (tmp_path / "small.txt").write_text("x" * 10)
+        (tmp_path / "big.json").write_text("x" * 5000)
+        
+        result = scan_project(tmp_path, max_bytes=1000)
+        assert result.files_count == 1
+        assert result.char_count == 10
+        assert result.skipped_large == 1
+        assert scan_project(tmp_path).files_count == 2
+
+    def test_scandir_fallback_agrees(self, project, monkeypatch):
+        result = scan_project(project, max_bytes=1000)
+        monkeypatch.setattr(metrics, "HAVE_FWALK", False)
+        assert scan_project(project, max_bytes=1000) == result
+    
+    def test_missing_path(self, tmp_path):
+        result = scan_project(tmp_path / "missing")
+        assert result.files_count == 0
+
+    def test_formatted_tokens(self):
+        assert ScanResult(files_count=1, char_count=0, token_est=1500).formatted_tokens == "1.5K"
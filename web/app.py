@@ -428,20 +428,11 @@ def create_app() -> FastAPI:
             if not path.exists():
                 return {"success": False, "message": "Path does not exist"}
             
-            # Capture output
+            # Capture output, without ANSI codes
             import io
-            import re
-            old_stdout = sys.stdout
-            sys.stdout = buffer = io.StringIO()
-            
-            try:
-                result = health_check(path)
-            finally:
-                output = buffer.getvalue()
-                sys.stdout = old_stdout
-            
-            # Remove ANSI codes
-            clean_output = re.sub(r'\x1b\[[0-9;]*m', '', output)
+            buffer = io.StringIO()
+            result = health_check(path, writer=buffer, color=False)
+            clean_output = buffer.getvalue()
             
             return {
                 "success": True,